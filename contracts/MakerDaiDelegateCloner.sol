@@ -7,16 +7,26 @@ import "./Strategy.sol";
 contract MakerDaiDelegateCloner {
     using SafeERC20 for IERC20;
     address public immutable original;
+    // keccak256 of the EIP-1167 code of a clone of original, used to predict CREATE2 addresses
+    bytes32 public immutable cloneCodeHash;
 
     event Cloned(address indexed clone);
     event Deployed(address indexed original);
 
+    // Per clone settings of a batch, keeper, rewards and strategist are shared
+    struct CloneParams {
+        address vault;
+        string strategyName;
+        bytes32 ilk_yieldBearing;
+        address gemJoin;
+    }
+
     constructor(
         address _vault,
-        string memory _strategyName
+        string memory _strategyName,
     //    bytes32 _ilk_want,
-    //    bytes32 _ilk_yieldBearing,
-    //    address _gemJoin
+        bytes32 _ilk_yieldBearing,
+        address _gemJoin
    //     address _wantToUSDOSMProxy
    //     address _yieldBearingToUSDOSMProxy
    //     address _chainlinkWantToETHPriceFeed
@@ -24,10 +34,10 @@ contract MakerDaiDelegateCloner {
         Strategy _original =
             new Strategy(
                 _vault,
-                _strategyName
+                _strategyName,
    //             _ilk_want,
-   //             _ilk_yieldBearing,
-   //             _gemJoin
+                _ilk_yieldBearing,
+                _gemJoin
     //            _wantToUSDOSMProxy
     //            _yieldBearingToUSDOSMProxy
     //            _chainlinkWantToETHPriceFeed
@@ -35,6 +45,7 @@ contract MakerDaiDelegateCloner {
         emit Deployed(address(_original));
 
         original = address(_original);
+        cloneCodeHash = keccak256(_cloneCode(address(_original)));
 
         Strategy(_original).setRewards(
             0xc491599b9A20c3A2F0A85697Ee6D9434EFa9f503
@@ -52,10 +63,10 @@ contract MakerDaiDelegateCloner {
         address _strategist,
         address _rewards,
         address _keeper,
-        string memory _strategyName
+        string memory _strategyName,
  //       bytes32 _ilk_want,
- //       bytes32 _ilk_yieldBearing,
- //       address _gemJoin
+        bytes32 _ilk_yieldBearing,
+        address _gemJoin
  //       address _wantToUSDOSMProxy
  //       address _yieldBearingToUSDOSMProxy
  //       address _chainlinkWantToETHPriceFeed
@@ -77,24 +88,84 @@ contract MakerDaiDelegateCloner {
             newStrategy := create(0, clone_code, 0x37)
         }
 
-        Strategy(newStrategy).initialize(
-            _vault,
-            _strategyName
-   //         _ilk_want,
-   //         _ilk_yieldBearing,
-   //         _gemJoin
-   //         _wantToUSDOSMProxy
-   //         _yieldBearingToUSDOSMProxy
-   //         _chainlinkWantToETHPriceFeed
+        _initializeClone(
+            newStrategy,
+            CloneParams(_vault, _strategyName, _ilk_yieldBearing, _gemJoin),
+            _strategist,
+            _rewards,
+            _keeper
         );
-        Strategy(newStrategy).setKeeper(_keeper);
-        Strategy(newStrategy).setRewards(_rewards);
-        Strategy(newStrategy).setStrategist(_strategist);
+    }
+
+    // Deploys one clone per entry of _params with CREATE2 in a single transaction.
+    // Clone i lands at predictCloneAddress(msg.sender, _salt, i)
+    function cloneMakerDaiDelegateBatch(
+        CloneParams[] memory _params,
+        address _strategist,
+        address _rewards,
+        address _keeper,
+        bytes32 _salt
+    ) external returns (address[] memory newStrategies) {
+        newStrategies = new address[](_params.length);
+        bytes memory cloneCode = _cloneCode(original);
+        for (uint256 i = 0; i < _params.length; i++) {
+            bytes32 salt = _cloneSalt(msg.sender, _salt, i);
+            address newStrategy;
+            assembly {
+                newStrategy := create2(0, add(cloneCode, 0x20), mload(cloneCode), salt)
+            }
+            require(newStrategy != address(0)); // dev: salt already used
+            _initializeClone(newStrategy, _params[i], _strategist, _rewards, _keeper);
+            newStrategies[i] = newStrategy;
+        }
+    }
 
-        emit Cloned(newStrategy);
+    // Address of clone _index of a cloneMakerDaiDelegateBatch call by _deployer with _salt
+    function predictCloneAddress(address _deployer, bytes32 _salt, uint256 _index) external view returns (address) {
+        return address(uint256(keccak256(abi.encodePacked(
+            bytes1(0xff),
+            address(this),
+            _cloneSalt(_deployer, _salt, _index),
+            cloneCodeHash
+        ))));
     }
 
     function name() external pure returns (string memory) {
         return "Yearn-MakerDaiDelegateCloner";
     }
+
+    function _initializeClone(
+        address _newStrategy,
+        CloneParams memory _params,
+        address _strategist,
+        address _rewards,
+        address _keeper
+    ) internal {
+        // keeper, rewards and strategist are set by initialize, no setter calls needed
+        Strategy(_newStrategy).initialize(
+            _params.vault,
+            _strategist,
+            _rewards,
+            _keeper,
+            _params.strategyName,
+            _params.ilk_yieldBearing,
+            _params.gemJoin
+        );
+
+        emit Cloned(_newStrategy);
+    }
+
+    // The deployer is part of the salt so nobody else can take a precomputed address
+    function _cloneSalt(address _deployer, bytes32 _salt, uint256 _index) internal pure returns (bytes32) {
+        return keccak256(abi.encodePacked(_deployer, _salt, _index));
+    }
+
+    // EIP-1167 minimal proxy delegating to _implementation
+    function _cloneCode(address _implementation) internal pure returns (bytes memory) {
+        return abi.encodePacked(
+            hex"3d602d80600a3d3981f3363d3d373d3d3d363d73",
+            _implementation,
+            hex"5af43d82803e903d91602b57fd5bf3"
+        );
+    }
 }
@@ -7,6 +7,7 @@ import "@openzeppelin/contracts/math/Math.sol";
 import {IERC20,Address} from "@openzeppelin/contracts/token/ERC20/SafeERC20.sol";
 import "./libraries/MakerDaiDelegateLib.sol";
 import "../interfaces/yearn/IBaseFee.sol";
+import "../interfaces/chainlink/AggregatorInterface.sol";
 import "../interfaces/yearn/IVault.sol";
 import "../interfaces/GUNI/GUniPool.sol";
 
@@ -15,23 +16,21 @@ contract Strategy is BaseStrategy {
 
     //event Debug(uint256 _number, uint _value);
 
-    enum Action {WIND, UNWIND}
+    // Position changes for off-chain indexing. Amounts in [wad], debt and collateral are the cdp balances afterwards
+    event Wind(uint256 flashloanAmount, uint256 yieldBearingMinted, uint256 psmVolume, uint256 debt, uint256 collateral);
+    event Unwind(uint256 flashloanAmount, uint256 yieldBearingBurned, uint256 psmVolume, uint256 debt, uint256 collateral);
+    event Rebalance(uint256 ratioBefore, uint256 ratioAfter, uint256 debt, uint256 collateral);
 
-    //GUNIDAIUSDC1 - Gelato Uniswap DAI/USDC LP - 0.05% fee
-    //GUniPool internal constant yieldBearing = GUniPool(0xAbDDAfB225e10B90D798bB8A886238Fb835e2053);
-    //bytes32 internal constant ilk_yieldBearing = 0x47554e49563344414955534443312d4100000000000000000000000000000000;
-    //address internal constant gemJoinAdapter = 0xbFD445A97e7459b0eBb34cfbd3245750Dba4d7a4;
-    
-    //GUNIDAIUSDC2 - Gelato Uniswap DAI/USDC2 LP 2 - 0.01% fee
-    GUniPool internal constant yieldBearing = GUniPool(0x50379f632ca68D36E50cfBC8F78fe16bd1499d1e);
-    bytes32 internal constant ilk_yieldBearing = 0x47554e49563344414955534443322d4100000000000000000000000000000000;
-    address internal constant gemJoinAdapter = 0xA7e4dDde3cBcEf122851A7C8F7A55f23c0Daf335;
+    enum Action {WIND, UNWIND, UNWIND_PARTIAL}
 
     //Flashmint:
     address internal constant flashmint = 0x1EB4CF3A948E7D72A198fe073cCb8C7a948cD853;
 
     IERC20 internal constant borrowToken = IERC20(0x6B175474E89094C44Da98b954EedeAC495271d0F);
 
+    // Chainlink ETH/USD, want is DAI
+    AggregatorInterface internal constant ethToUsd = AggregatorInterface(0x5f4eC3Df9cbd43714FE2740f5E3616155c5b8419);
+
     //----------- MAKER INIT    
     // Units used in Maker contracts
     uint256 internal constant WAD = 10**18;
@@ -39,23 +38,72 @@ contract Strategy is BaseStrategy {
 
     // maker vault identifier
     uint256 public cdpId;
-
-    //Desired collaterization ratio
-    //Directly affects the leverage multiplier for every investment to leverage up the Maker vault with yieldBearing: 
-    //Off-chain calculation geometric converging series: sum(1/1.02^n)-1 for n=0-->infinity --> for 102% collateralization ratio = 50x leverage.
-    uint256 public collateralizationRatio;
-
-    // Allow the collateralization ratio to drift a bit in order to avoid cycles
-    uint256 public lowerRebalanceTolerance;
-    uint256 public upperRebalanceTolerance;
-
-    bool internal forceHarvestTriggerOnce; // only set this to true when we want to trigger our keepers to harvest for us
-    uint256 public creditThreshold; // amount of credit in underlying tokens that will automatically trigger a harvest  
-
-    // Maximum Single Trade possible
-    uint256 public maxSingleTrade;
-    // Minimum Single Trade & Minimum Profit to be taken:
-    uint256 public minSingleTrade;
+    // vat address of the cdp, resolved when the cdp is opened or shifted
+    address public urn;
+    // conversion of collateral amounts to the vat's 18 decimals
+    uint256 internal collateralTo18Conversion;
+
+    //G-UNI pool used as collateral, set at initialization:
+    //GUNIDAIUSDC1 - Gelato Uniswap DAI/USDC LP - 0.05% fee: ilk GUNIV3DAIUSDC1-A, gemJoin 0xbFD445A97e7459b0eBb34cfbd3245750Dba4d7a4
+    //GUNIDAIUSDC2 - Gelato Uniswap DAI/USDC2 LP 2 - 0.01% fee: ilk GUNIV3DAIUSDC2-A, gemJoin 0xA7e4dDde3cBcEf122851A7C8F7A55f23c0Daf335
+    GUniPool public yieldBearing;
+    bytes32 public ilk_yieldBearing;
+    address public gemJoinAdapter;
+
+    // Risk parameters packed into three slots, read through the uint256 getters below.
+    // First slot holds the target ratio and the rebalance band, the third one
+    // minSingleTrade and the inputs of the wind and releverage gas checks.
+    struct RiskParameters {
+        //Desired collaterization ratio [wad], at most ~4700x
+        //Directly affects the leverage multiplier for every investment to leverage up the Maker vault with yieldBearing: 
+        //Off-chain calculation geometric converging series: sum(1/1.02^n)-1 for n=0-->infinity --> for 102% collateralization ratio = 50x leverage.
+        uint72 collateralizationRatio;
+        // Allow the collateralization ratio to drift a bit in order to avoid cycles [wad]
+        uint92 lowerRebalanceTolerance;
+        uint92 upperRebalanceTolerance;
+        // Maximum Single Trade possible
+        uint120 maxSingleTrade;
+        uint128 creditThreshold; // amount of credit in underlying tokens that will automatically trigger a harvest  
+        bool forceHarvestTriggerOnce; // only set this to true when we want to trigger our keepers to harvest for us
+        // Minimum Single Trade & Minimum Profit to be taken
+        uint128 minSingleTrade;
+        // Expected yearly yield of the G-UNI collateral [wad], at most 1800%. 0 disables the releverage gas check
+        uint64 yieldBearingApr;
+        // Time over which the yield of a releverage has to pay for the tend, in seconds
+        uint32 tendHorizon;
+    }
+
+    RiskParameters internal riskParameters;
+
+    // G-UNI price read by prepareReturn or liquidateAllPositions, handed to the adjustPosition
+    // of the same harvest and cleared there. Zero outside a harvest, never outlives the transaction
+    uint256 internal harvestWantPerYieldBearing;
+
+    // Snapshot returned by getStrategyState for monitoring and keepers
+    struct StrategyState {
+        uint256 cdpId;
+        address urn;
+        uint256 wantPerYieldBearing;
+        uint256 balanceOfWant;
+        uint256 balanceOfYieldBearing;
+        uint256 balanceOfMakerVault;
+        uint256 balanceOfDebt;
+        uint256 currentMakerVaultRatio;
+        uint256 estimatedTotalAssets;
+        uint256 balanceOfDaiAvailableToMint;
+        uint256 undeployedWant;
+        uint256 collateralizationRatio;
+        uint256 lowerRebalanceTolerance;
+        uint256 upperRebalanceTolerance;
+        uint256 minSingleTrade;
+        uint256 maxSingleTrade;
+        uint256 creditThreshold;
+        uint256 yieldBearingApr;
+        uint256 tendHorizon;
+        // Both triggers for a call cost of 0
+        bool tendTrigger;
+        bool harvestTrigger;
+    }
 
     // Name of the strategy
     string internal strategyName;
@@ -64,37 +112,55 @@ contract Strategy is BaseStrategy {
 
     constructor(
         address _vault,
-        string memory _strategyName
+        string memory _strategyName,
+        bytes32 _ilk_yieldBearing,
+        address _gemJoin
     ) public BaseStrategy(_vault) {
         _initializeThis(
-            _strategyName
+            _strategyName,
+            _ilk_yieldBearing,
+            _gemJoin
         );
     }
 
     function initialize(
         address _vault,
-        string memory _strategyName
+        address _strategist,
+        address _rewards,
+        address _keeper,
+        string memory _strategyName,
+        bytes32 _ilk_yieldBearing,
+        address _gemJoin
     ) public {
-        address sender = msg.sender;
         // Initialize BaseStrategy
-        _initialize(_vault, sender, sender, sender);
+        _initialize(_vault, _strategist, _rewards, _keeper);
         // Initialize cloned instance
         _initializeThis(
-            _strategyName
+            _strategyName,
+            _ilk_yieldBearing,
+            _gemJoin
         );
     }
 
     function _initializeThis(
-        string memory _strategyName
+        string memory _strategyName,
+        bytes32 _ilk_yieldBearing,
+        address _gemJoin
     ) internal {
+        // A gemJoin of another ilk would open the cdp on the wrong collateral type
+        require(GemJoinLike(_gemJoin).ilk() == _ilk_yieldBearing); // dev: gemJoin does not match ilk
         strategyName = _strategyName;
+        ilk_yieldBearing = _ilk_yieldBearing;
+        gemJoinAdapter = _gemJoin;
+        yieldBearing = GUniPool(address(GemJoinLike(_gemJoin).gem()));
 
         //10M$ dai or usdc maximum trade
-        maxSingleTrade = 10_000_000 * 1e18;
+        riskParameters.maxSingleTrade = 10_000_000 * 1e18;
         //10M$ dai or usdc maximum trade
-        minSingleTrade = 1 * 1e17;
+        riskParameters.minSingleTrade = 1 * 1e17;
 
-        creditThreshold = 1e6 * 1e18;
+        riskParameters.creditThreshold = 1e6 * 1e18;
+        riskParameters.tendHorizon = 30 days;
         maxReportDelay = 21 days; // 21 days in seconds, if we hit this then harvestTrigger = True
 
         // Set health check to health.ychad.eth
@@ -102,14 +168,17 @@ contract Strategy is BaseStrategy {
 
         cdpId = MakerDaiDelegateLib.openCdp(ilk_yieldBearing);
         require(cdpId > 0); // dev: error opening cdp
+        urn = MakerDaiDelegateLib.urnForCdp(cdpId);
+        collateralTo18Conversion = MakerDaiDelegateLib.getCollateralTo18Conversion(_gemJoin);
+        MakerDaiDelegateLib.approveSpenders(yieldBearing, _gemJoin);
 
         // Current ratio can drift
         // Allow additional 0.002 = 0.2% in any direction by default ==> 102.5% upper, 102.1% lower
-        upperRebalanceTolerance = (20 * WAD) / 10000;
-        lowerRebalanceTolerance = (20 * WAD) / 10000;
+        riskParameters.upperRebalanceTolerance = uint92((20 * WAD) / 10000);
+        riskParameters.lowerRebalanceTolerance = uint92((20 * WAD) / 10000);
 
         // Minimum collateralization ratio for GUNIV3DAIUSDC is 102.3% == 10230
-        collateralizationRatio = (10230 * WAD) / 10000;
+        riskParameters.collateralizationRatio = uint72((10230 * WAD) / 10000);
 
     }
 
@@ -121,19 +190,31 @@ contract Strategy is BaseStrategy {
         external
         onlyVaultManagers
     {
-        forceHarvestTriggerOnce = _forceHarvestTriggerOnce;
+        riskParameters.forceHarvestTriggerOnce = _forceHarvestTriggerOnce;
     }
 
     function setCreditThreshold(uint256 _creditThreshold)
         external
         onlyVaultManagers
     {
-        creditThreshold = _creditThreshold;
+        require(_creditThreshold <= type(uint128).max); // dev: credit threshold too high
+        riskParameters.creditThreshold = uint128(_creditThreshold);
     }
 
     function setMinMaxSingleTrade(uint256 _minSingleTrade, uint256 _maxSingleTrade) external onlyVaultManagers {
-        minSingleTrade = _minSingleTrade;
-        maxSingleTrade = _maxSingleTrade;
+        require(_minSingleTrade <= type(uint128).max); // dev: min single trade too high
+        require(_maxSingleTrade <= type(uint120).max); // dev: max single trade too high
+        riskParameters.minSingleTrade = uint128(_minSingleTrade);
+        riskParameters.maxSingleTrade = uint120(_maxSingleTrade);
+    }
+
+    // Releverage tends only trigger once the yield of the extra debt over _tendHorizon
+    // covers the call cost. _yieldBearingApr = 0 turns the check off
+    function setTendProfitability(uint256 _yieldBearingApr, uint256 _tendHorizon) external onlyVaultManagers {
+        require(_yieldBearingApr <= type(uint64).max); // dev: yield too high
+        require(_tendHorizon <= type(uint32).max); // dev: horizon too long
+        riskParameters.yieldBearingApr = uint64(_yieldBearingApr);
+        riskParameters.tendHorizon = uint32(_tendHorizon);
     }
 
     // Target collateralization ratio to maintain within bounds
@@ -141,8 +222,9 @@ contract Strategy is BaseStrategy {
         external
         onlyEmergencyAuthorized
     {
-        require(_collateralizationRatio.sub(lowerRebalanceTolerance) > MakerDaiDelegateLib.getLiquidationRatio(ilk_yieldBearing).mul(WAD).div(RAY)); // dev: desired collateralization ratio is too low
-        collateralizationRatio = _collateralizationRatio;
+        require(_collateralizationRatio <= type(uint72).max); // dev: desired collateralization ratio is too high
+        require(_collateralizationRatio.sub(lowerRebalanceTolerance()) > MakerDaiDelegateLib.getLiquidationRatio(ilk_yieldBearing).mul(WAD).div(RAY)); // dev: desired collateralization ratio is too low
+        riskParameters.collateralizationRatio = uint72(_collateralizationRatio);
     }
 
     // Rebalancing bands (collat ratio - tolerance, collat_ratio plus tolerance)
@@ -150,9 +232,44 @@ contract Strategy is BaseStrategy {
         external
         onlyEmergencyAuthorized
     {
-        require(collateralizationRatio.sub(_lowerRebalanceTolerance) > MakerDaiDelegateLib.getLiquidationRatio(ilk_yieldBearing).mul(WAD).div(RAY)); // dev: desired rebalance tolerance makes allowed ratio too low
-        lowerRebalanceTolerance = _lowerRebalanceTolerance;
-        upperRebalanceTolerance = _upperRebalanceTolerance;
+        require(_lowerRebalanceTolerance <= type(uint92).max && _upperRebalanceTolerance <= type(uint92).max); // dev: desired rebalance tolerance is too high
+        require(collateralizationRatio().sub(_lowerRebalanceTolerance) > MakerDaiDelegateLib.getLiquidationRatio(ilk_yieldBearing).mul(WAD).div(RAY)); // dev: desired rebalance tolerance makes allowed ratio too low
+        riskParameters.lowerRebalanceTolerance = uint92(_lowerRebalanceTolerance);
+        riskParameters.upperRebalanceTolerance = uint92(_upperRebalanceTolerance);
+    }
+
+    // ----------------- RISK PARAMETER GETTERS -----------------
+
+    function collateralizationRatio() public view returns (uint256) {
+        return riskParameters.collateralizationRatio;
+    }
+
+    function lowerRebalanceTolerance() public view returns (uint256) {
+        return riskParameters.lowerRebalanceTolerance;
+    }
+
+    function upperRebalanceTolerance() public view returns (uint256) {
+        return riskParameters.upperRebalanceTolerance;
+    }
+
+    function creditThreshold() public view returns (uint256) {
+        return riskParameters.creditThreshold;
+    }
+
+    function minSingleTrade() public view returns (uint256) {
+        return riskParameters.minSingleTrade;
+    }
+
+    function maxSingleTrade() public view returns (uint256) {
+        return riskParameters.maxSingleTrade;
+    }
+
+    function yieldBearingApr() public view returns (uint256) {
+        return riskParameters.yieldBearingApr;
+    }
+
+    function tendHorizon() public view returns (uint256) {
+        return riskParameters.tendHorizon;
     }
 
     // Required to move funds to a new cdp and use a different cdpId after migration
@@ -160,6 +277,12 @@ contract Strategy is BaseStrategy {
     function shiftToCdp(uint256 newCdpId) external onlyGovernance {
         MakerDaiDelegateLib.shiftCdp(cdpId, newCdpId);
         cdpId = newCdpId;
+        urn = MakerDaiDelegateLib.urnForCdp(newCdpId);
+    }
+
+    // Tops the fixed spender allowances back up, e.g. if a token spends them down
+    function reapproveSpenders() external onlyGovernance {
+        MakerDaiDelegateLib.approveSpenders(yieldBearing, gemJoinAdapter);
     }
 
     // Allow address to manage Maker's CDP
@@ -176,7 +299,19 @@ contract Strategy is BaseStrategy {
         external
         onlyVaultManagers
     {
-        MakerDaiDelegateLib.unwind(repayAmountOfWant, getCurrentMakerVaultRatio(), cdpId);
+        uint256 wantPerYieldBearing = getWantPerYieldBearing();
+        MakerDaiDelegateLib.unwind(repayAmountOfWant, _getCurrentMakerVaultRatio(wantPerYieldBearing), wantPerYieldBearing, _cdp());
+    }
+
+    // Cheapest route to a safer ratio in a depeg: repays _debtShare [wad] of the debt
+    // through the partial unwind, skipping the Maker hygiene calls and the re-lock.
+    // 1e18 repays all of it
+    function emergencyDeleverage(uint256 _debtShare)
+        external
+        onlyVaultManagers
+    {
+        require(_debtShare > 0 && _debtShare <= WAD); // dev: invalid debt share
+        MakerDaiDelegateLib.emergencyDeleverage(_debtShare, getWantPerYieldBearing(), _cdp());
     }
 
 
@@ -188,10 +323,16 @@ contract Strategy is BaseStrategy {
     }
 
     function estimatedTotalAssets() public view override returns (uint256) {  //measured in WANT
+        return _estimatedTotalAssets(getWantPerYieldBearing());
+    }
+
+    function _estimatedTotalAssets(uint256 _wantPerYieldBearing) internal view returns (uint256) {
+        // Collateral and debt come from one read of the urn and the ilk
+        (uint256 collateral, uint256 debt) = _getCdpBalances();
         return  
                 balanceOfWant() //free WANT balance in wallet
-                .add(balanceOfYieldBearing().add(balanceOfMakerVault()).mul(getWantPerYieldBearing()).div(WAD))
-                .sub(balanceOfDebt());
+                .add(balanceOfYieldBearing().add(collateral).mul(_wantPerYieldBearing).div(WAD))
+                .sub(debt);
                 //want=usdc:
                 //.add(_convertBorrowTokenAmountToWant(balanceOfBorrowToken()))  // free DAI balance in wallet --> WANT
                 //.sub(_convertBorrowTokenAmountToWant(balanceOfDebt()));  //DAI debt of maker --> WANT
@@ -207,13 +348,16 @@ contract Strategy is BaseStrategy {
         )
     {
         uint256 totalDebt = vault.strategies(address(this)).totalDebt;
-        uint256 totalAssetsAfterProfit = estimatedTotalAssets();
+        // G-UNI price is read once and passed on for the whole harvest, adjustPosition included
+        uint256 wantPerYieldBearing = getWantPerYieldBearing();
+        harvestWantPerYieldBearing = wantPerYieldBearing;
+        uint256 totalAssetsAfterProfit = _estimatedTotalAssets(wantPerYieldBearing);
         //Here minSingleTrade represents the minimum profit of want that should be given back to the vault
-        _profit = totalAssetsAfterProfit > ( totalDebt + minSingleTrade ) 
+        _profit = totalAssetsAfterProfit > ( totalDebt + minSingleTrade() ) 
             ? totalAssetsAfterProfit.sub(totalDebt)
             : 0;
         uint256 _amountFreed;
-        (_amountFreed, _loss) = liquidatePosition(Math.min(maxSingleTrade, _debtOutstanding.add(_profit)));
+        (_amountFreed, _loss) = _liquidateWant(Math.min(maxSingleTrade(), _debtOutstanding.add(_profit)), wantPerYieldBearing);
         _debtPayment = Math.min(_debtOutstanding, _amountFreed);
         //Net profit and loss calculation
         if (_loss > _profit) {
@@ -225,34 +369,45 @@ contract Strategy is BaseStrategy {
         }
 
         // we're done harvesting, so reset our trigger if we used it
-        forceHarvestTriggerOnce = false;
+        riskParameters.forceHarvestTriggerOnce = false;
     }
 
     function adjustPosition(uint256 _debtOutstanding) internal override {
         // Update accumulated stability fees,  Update the debt ceiling using DSS Auto Line
         MakerDaiDelegateLib.keepBasicMakerHygiene(ilk_yieldBearing);
+        // G-UNI price is read once and passed on for the whole tend/harvest step
+        uint256 wantPerYieldBearing = _takeHarvestWantPerYieldBearing();
+        // Only set when the ratio is moved back into the band, reported in the Rebalance event
+        uint256 ratioBefore;
         // If we have enough want to convert and deposit more into the maker vault, we do it
         //Here minSingleTrade represents the minimum investment of want that makes it worth it to loop 
-        if (balanceOfWant() > _debtOutstanding.add(minSingleTrade) ) {
-            MakerDaiDelegateLib.wind(Math.min(maxSingleTrade, balanceOfWant().sub(_debtOutstanding)), collateralizationRatio, cdpId);
+        if (balanceOfWant() > _debtOutstanding.add(minSingleTrade()) ) {
+            MakerDaiDelegateLib.wind(Math.min(maxSingleTrade(), balanceOfWant().sub(_debtOutstanding)), collateralizationRatio(), _cdp());
         } else {
             //Check if collateralizationRatio needs adjusting
             // Allow the ratio to move a bit in either direction to avoid cycles
-            uint256 currentRatio = getCurrentMakerVaultRatio();
-            if (currentRatio < collateralizationRatio.sub(lowerRebalanceTolerance)) { //if current ratio is BELOW goal ratio:
-                uint256 currentCollateral = balanceOfMakerVault();
-                uint256 yieldBearingToRepay = currentCollateral.sub( currentCollateral.mul(currentRatio).div(collateralizationRatio)  );
-                uint256 wantAmountToRepay = yieldBearingToRepay.mul(getWantPerYieldBearing()).div(WAD);
-                MakerDaiDelegateLib.unwind(wantAmountToRepay, collateralizationRatio, cdpId);
-            } else if (currentRatio > collateralizationRatio.add(upperRebalanceTolerance)) { //if current ratio is ABOVE goal ratio:
-                // Mint the maximum DAI possible for the locked collateral            
-                _lockCollateralAndMintDai(0, _borrowTokenAmountToMint(balanceOfMakerVault()).sub(balanceOfDebt()));
-                MakerDaiDelegateLib.wind(Math.min(maxSingleTrade, balanceOfWant().sub(_debtOutstanding)), collateralizationRatio, cdpId);
+            uint256 currentRatio = _getCurrentMakerVaultRatio(wantPerYieldBearing);
+            if (currentRatio < collateralizationRatio().sub(lowerRebalanceTolerance())) { //if current ratio is BELOW goal ratio:
+                ratioBefore = currentRatio;
+                // Nothing is requested: the partial unwind only repays the debt that takes the cdp back to the target
+                MakerDaiDelegateLib.unwind(0, collateralizationRatio(), wantPerYieldBearing, _cdp());
+            } else if (currentRatio > collateralizationRatio().add(upperRebalanceTolerance())) { //if current ratio is ABOVE goal ratio:
+                // Lever back up to the goal ratio with a single flashmint and frob
+                ratioBefore = currentRatio;
+                uint256 wantBalance = balanceOfWant();
+                uint256 wantToInvest = wantBalance > _debtOutstanding ? Math.min(maxSingleTrade(), wantBalance.sub(_debtOutstanding)) : 0;
+                MakerDaiDelegateLib.releverage(wantToInvest, collateralizationRatio(), wantPerYieldBearing, _cdp());
             }
         }
         //Check safety of collateralization ratio after all actions:
-        if (balanceOfMakerVault() > 0) {
-            require(getCurrentMakerVaultRatio() > collateralizationRatio.sub(lowerRebalanceTolerance), "unsafe collateralization");
+        uint256 collateral = balanceOfMakerVault();
+        if (collateral > 0) {
+            uint256 debt = balanceOfDebt();
+            uint256 ratioAfter = _getMakerVaultRatio(collateral, debt, wantPerYieldBearing);
+            require(ratioAfter > collateralizationRatio().sub(lowerRebalanceTolerance()), "unsafe collateralization");
+            if (ratioBefore > 0) {
+                emit Rebalance(ratioBefore, ratioAfter, debt, collateral);
+            }
         }
 
     }
@@ -261,6 +416,13 @@ contract Strategy is BaseStrategy {
         internal
         override
         returns (uint256 _liquidatedAmount, uint256 _loss)
+    {
+        return _liquidateWant(_wantAmountNeeded, getWantPerYieldBearing());
+    }
+
+    function _liquidateWant(uint256 _wantAmountNeeded, uint256 _wantPerYieldBearing)
+        internal
+        returns (uint256 _liquidatedAmount, uint256 _loss)
     {
         uint256 wantBalance = balanceOfWant();
         //Check if we can handle it without swapping free yieldBearing or freeing collateral yieldBearing
@@ -268,7 +430,7 @@ contract Strategy is BaseStrategy {
             return (_wantAmountNeeded, 0);
         }
         //Not enough want to pay _wantAmountNeeded --> unwind position
-        MakerDaiDelegateLib.unwind(_wantAmountNeeded.sub(wantBalance), collateralizationRatio, cdpId);
+        MakerDaiDelegateLib.unwind(_wantAmountNeeded.sub(wantBalance), collateralizationRatio(), _wantPerYieldBearing, _cdp());
 
         //update free want after liquidating
         uint256 looseWant = balanceOfWant();
@@ -287,7 +449,9 @@ contract Strategy is BaseStrategy {
         override
         returns (uint256 _amountFreed)
     {
-        (_amountFreed, ) = liquidatePosition(estimatedTotalAssets());
+        uint256 wantPerYieldBearing = getWantPerYieldBearing();
+        harvestWantPerYieldBearing = wantPerYieldBearing;
+        (_amountFreed, ) = _liquidateWant(_estimatedTotalAssets(wantPerYieldBearing), wantPerYieldBearing);
     }
 
     function harvestTrigger(uint256 callCostInWei)
@@ -296,30 +460,27 @@ contract Strategy is BaseStrategy {
         override
         returns (bool)
     {
-        // Should not trigger if strategy is not active (no assets and no debtRatio). This means we don't need to adjust keeper job.
-        if (!isActive()) {
-            return false;
-        }
+        // Cheapest decisive checks first: one vault.strategies read serves isActive and
+        // lastReport, and the base fee oracle is only asked once a harvest is due
+        StrategyParams memory params = vault.strategies(address(this));
 
-        // check if the base fee gas price is higher than we allow. if it is, block harvests.
-        if (!isBaseFeeAcceptable()) {
+        // Should not trigger if strategy is not active (no assets and no debtRatio). This means we don't need to adjust keeper job.
+        if (params.debtRatio == 0 && estimatedTotalAssets() == 0) {
             return false;
         }
 
         // trigger if we want to manually harvest, but only if our gas price is acceptable
-        if (forceHarvestTriggerOnce) {
-            return true;
+        if (riskParameters.forceHarvestTriggerOnce) {
+            return isBaseFeeAcceptable();
         }
 
-        StrategyParams memory params = vault.strategies(address(this));
-        // harvest once we reach our maxDelay if our gas price is okay
-        if (block.timestamp.sub(params.lastReport) > maxReportDelay) {
-            return true;
-        }
-
-        // harvest our credit if it's above our threshold
-        if (vault.creditAvailable() > creditThreshold) {
-            return true;
+        // harvest once we reach our maxDelay or our credit is above our threshold
+        if (
+            block.timestamp.sub(params.lastReport) > maxReportDelay ||
+            vault.creditAvailable() > creditThreshold()
+        ) {
+            // check if the base fee gas price is higher than we allow. if it is, block harvests.
+            return isBaseFeeAcceptable();
         }
 
         // otherwise, we don't harvest
@@ -333,23 +494,96 @@ contract Strategy is BaseStrategy {
         returns (bool)
     {
         // Nothing to adjust if there is no collateral locked
-        if (balanceOfMakerVault() == 0) {
+        (uint256 collateral, uint256 debt, uint256 spotPrice) = _getCdpSnapshot();
+        if (collateral == 0) {
             return false;
         }
 
-        uint256 currentRatio = getCurrentMakerVaultRatio();
+        uint256 wantPerYieldBearing = getWantPerYieldBearing();
+        uint256 currentRatio = MakerDaiDelegateLib._pessimisticRatio(collateral, debt, spotPrice, wantPerYieldBearing, WAD);
+        return _tendTrigger(currentRatio, debt, callCostInWei);
+    }
+
+    function _tendTrigger(
+        uint256 _currentRatio,
+        uint256 _debt,
+        uint256 _callCostInWei
+    ) internal view returns (bool) {
+        uint256 targetRatio = collateralizationRatio();
+
         // If we need to repay debt and are outside the tolerance bands,
         // we do it regardless of the call cost
-        if (currentRatio < collateralizationRatio.sub(lowerRebalanceTolerance)) {
+        if (_currentRatio < targetRatio.sub(lowerRebalanceTolerance())) {
             return true;
         }
 
-        // Mint more DAI if possible
-        return
-            currentRatio > collateralizationRatio.add(upperRebalanceTolerance) &&
-            balanceOfDebt() > 0 &&
-            isBaseFeeAcceptable() &&
-            MakerDaiDelegateLib.isDaiAvailableToMint(ilk_yieldBearing);
+        // Wind the next chunk of a deposit above maxSingleTrade,
+        // or mint more DAI if we are above the band
+        uint256 toWind = undeployedWant();
+        bool releverage = _currentRatio > targetRatio.add(upperRebalanceTolerance()) && _debt > 0;
+        // Most keeper polls end here, before the base fee oracle and the vat are read
+        if (toWind == 0 && !releverage) {
+            return false;
+        }
+
+        if (!isBaseFeeAcceptable() || !MakerDaiDelegateLib.isDaiAvailableToMint(ilk_yieldBearing)) {
+            return false;
+        }
+
+        // Wind or releverage only if the extra yield pays for the call
+        if (toWind > 0 && _isWindWorthTheCall(toWind, _debt, _callCostInWei)) {
+            return true;
+        }
+        return releverage && _isReleverageWorthTheCall(_currentRatio, _debt, _callCostInWei);
+    }
+
+    // A wind locks the next chunk W and the flashmint F = W / (r - 1), see MakerDaiDelegateLib.wind.
+    // Chunks that would leave the debt under the floor are not wound
+    function _isWindWorthTheCall(
+        uint256 _toWind,
+        uint256 _debt,
+        uint256 _callCostInWei
+    ) internal view returns (bool) {
+        uint256 chunk = Math.min(_toWind, maxSingleTrade());
+        uint256 flashloanAmount = chunk.mul(WAD).div(collateralizationRatio().sub(WAD));
+        if (_debt.add(flashloanAmount) <= MakerDaiDelegateLib.debtFloor(ilk_yieldBearing).add(1e15)) {
+            return false;
+        }
+        return _isLeverageWorthTheCall(chunk.add(flashloanAmount), flashloanAmount, _callCostInWei);
+    }
+
+    // Debt a releverage adds is F = (C*p - r*D) / (r - 1), see MakerDaiDelegateLib.releverage.
+    // C*p is priced pessimistically, C*p = currentRatio * D. The same F is locked as collateral
+    function _isReleverageWorthTheCall(
+        uint256 _currentRatio,
+        uint256 _debt,
+        uint256 _callCostInWei
+    ) internal view returns (bool) {
+        uint256 targetRatio = collateralizationRatio();
+        if (_currentRatio <= targetRatio) {
+            return false;
+        }
+        uint256 additionalDebt = _debt.mul(_currentRatio.sub(targetRatio)).div(targetRatio.sub(WAD));
+        return _isLeverageWorthTheCall(additionalDebt, additionalDebt, _callCostInWei);
+    }
+
+    // Collateral added earns the G-UNI yield and debt added pays the stability fee for tendHorizon
+    function _isLeverageWorthTheCall(
+        uint256 _addedCollateralValue,
+        uint256 _addedDebt,
+        uint256 _callCostInWei
+    ) internal view returns (bool) {
+        uint256 apr = yieldBearingApr();
+        if (apr == 0) {
+            return true;
+        }
+        uint256 yearlyYield = _addedCollateralValue.mul(apr).div(WAD);
+        uint256 yearlyFee = _addedDebt.mul(MakerDaiDelegateLib.getStabilityFeeApr(ilk_yieldBearing)).div(WAD);
+        if (yearlyYield <= yearlyFee) {
+            return false;
+        }
+        uint256 expectedYield = yearlyYield.sub(yearlyFee).mul(tendHorizon()).div(365 days);
+        return expectedYield > ethToWant(_callCostInWei);
     }
 
     function prepareMigration(address _newStrategy) internal override {
@@ -364,14 +598,16 @@ contract Strategy is BaseStrategy {
         returns (address[] memory)
     {}
 
-    // we don't need this anymore since we don't use baseStrategy harvestTrigger
+    // Prices the keeper call cost for tendTrigger, want is DAI and priced at 1 USD
     function ethToWant(uint256 _amtInWei)
         public
         view
         virtual
         override
         returns (uint256)
-    {}
+    {
+        return _amtInWei.mul(uint256(ethToUsd.latestAnswer())).div(1e8);
+    }
 
 
     // ----------------- FLASHLOAN CALLBACK -----------------
@@ -385,33 +621,42 @@ contract Strategy is BaseStrategy {
     ) external returns (bytes32) {
         require(msg.sender == flashmint);
         require(initiator == address(this));
-        (Action action, uint256 _cdpId, uint256 _wantAmountInitialOrRequested, uint256 flashloanAmount, uint256 _collateralizationRatio) = abi.decode(data, (Action, uint256, uint256, uint256, uint256));
         //amount = flashloanAmount, then add fee
-        amount = amount.add(fee);
-        _checkAllowance(address(flashmint), address(borrowToken), amount);
+        _onFlashLoan(amount.add(fee), data);
+        return keccak256("ERC3156FlashBorrower.onFlashLoan");
+    }
+
+    function _onFlashLoan(uint256 amount, bytes memory data) internal {
+        (Action action, uint256 _wantAmountInitialOrRequested, , uint256 _collateralizationRatio, uint256 _wantPerYieldBearing) = abi.decode(data, (Action, uint256, uint256, uint256, uint256));
+        uint256 yieldBearingAmount;
+        uint256 psmVolume;
         if (action == Action.WIND) {
-            MakerDaiDelegateLib._wind(_cdpId, amount, _wantAmountInitialOrRequested, _collateralizationRatio);
-        } else if (action == Action.UNWIND) {
-            MakerDaiDelegateLib._unwind(_cdpId, amount, _wantAmountInitialOrRequested, _collateralizationRatio);
+            (yieldBearingAmount, psmVolume) = MakerDaiDelegateLib._wind(_cdp(), amount, _wantAmountInitialOrRequested, _collateralizationRatio);
+            emit Wind(amount, yieldBearingAmount, psmVolume, balanceOfDebt(), balanceOfMakerVault());
+            return;
         }
-        return keccak256("ERC3156FlashBorrower.onFlashLoan");
+        if (action == Action.UNWIND) {
+            (yieldBearingAmount, psmVolume) = MakerDaiDelegateLib._unwind(_cdp(), amount, _wantAmountInitialOrRequested, _collateralizationRatio, _wantPerYieldBearing);
+        } else if (action == Action.UNWIND_PARTIAL) {
+            (yieldBearingAmount, psmVolume) = MakerDaiDelegateLib._unwindPartial(_cdp(), amount, _wantAmountInitialOrRequested, _collateralizationRatio, _wantPerYieldBearing);
+        }
+        emit Unwind(amount, yieldBearingAmount, psmVolume, balanceOfDebt(), balanceOfMakerVault());
     }
 
     // ----------------- INTERNAL FUNCTIONS SUPPORT -----------------
 
-    function _borrowTokenAmountToMint(uint256 _amount) internal returns (uint256) {
-        return _amount.mul(getWantPerYieldBearing()).mul(WAD).div(collateralizationRatio).div(WAD);
+    // G-UNI mints and burns are proportional, so the price prepareReturn read still holds in
+    // adjustPosition. A tend calls adjustPosition on its own and reads a fresh one
+    function _takeHarvestWantPerYieldBearing() internal returns (uint256 wantPerYieldBearing) {
+        wantPerYieldBearing = harvestWantPerYieldBearing;
+        if (wantPerYieldBearing == 0) {
+            return getWantPerYieldBearing();
+        }
+        harvestWantPerYieldBearing = 0;
     }
 
-    function _checkAllowance(
-        address _contract,
-        address _token,
-        uint256 _amount
-    ) internal {
-        if (IERC20(_token).allowance(address(this), _contract) < _amount) {
-            IERC20(_token).safeApprove(_contract, 0);
-            IERC20(_token).safeApprove(_contract, type(uint256).max);
-        }
+    function _cdp() internal view returns (MakerDaiDelegateLib.CdpConfig memory) {
+        return MakerDaiDelegateLib.CdpConfig(cdpId, ilk_yieldBearing, gemJoinAdapter, yieldBearing, urn, collateralTo18Conversion);
     }
 
 
@@ -431,13 +676,29 @@ contract Strategy is BaseStrategy {
         return wantUnderlyingBalance.add(otherTokenUnderlyingBalance.mul(1e12)).mul(WAD).div(yieldBearing.totalSupply());
     }
 
-    function balanceOfDebt() public view returns (uint256) {
-        return MakerDaiDelegateLib.debtForCdp(cdpId, ilk_yieldBearing);
+    function balanceOfDebt() public view virtual returns (uint256) {
+        return MakerDaiDelegateLib.debtForCdp(urn, ilk_yieldBearing);
     }
 
     // Returns collateral balance in the vault
-    function balanceOfMakerVault() public view returns (uint256) {
-        return MakerDaiDelegateLib.balanceOfCdp(cdpId, ilk_yieldBearing);
+    function balanceOfMakerVault() public view virtual returns (uint256) {
+        return MakerDaiDelegateLib.balanceOfCdp(urn, ilk_yieldBearing);
+    }
+
+    // Want adjustPosition winds on the next tend or harvest. Only the first maxSingleTrade of a
+    // large deposit is wound per call, the rest stays here until tendTrigger picks it up
+    function undeployedWant() public view returns (uint256) {
+        uint256 wantBalance = balanceOfWant();
+        uint256 minTrade = minSingleTrade();
+        // No chunk to wind whatever the vault asks back, skip the vault call
+        if (wantBalance <= minTrade) {
+            return 0;
+        }
+        uint256 debtOutstanding = vault.debtOutstanding();
+        if (wantBalance <= debtOutstanding.add(minTrade)) {
+            return 0;
+        }
+        return wantBalance.sub(debtOutstanding);
     }
 
     function balanceOfDaiAvailableToMint() public view returns (uint256) {
@@ -446,7 +707,55 @@ contract Strategy is BaseStrategy {
 
     // Effective collateralization ratio of the vault
     function getCurrentMakerVaultRatio() public view returns (uint256) {
-        return MakerDaiDelegateLib.getPessimisticRatioOfCdpWithExternalPrice(cdpId,ilk_yieldBearing,getWantPerYieldBearing(),WAD);
+        return _getCurrentMakerVaultRatio(getWantPerYieldBearing());
+    }
+
+    function _getCurrentMakerVaultRatio(uint256 _wantPerYieldBearing) internal view returns (uint256) {
+        return _getMakerVaultRatio(balanceOfMakerVault(), balanceOfDebt(), _wantPerYieldBearing);
+    }
+
+    function _getCdpBalances() internal view virtual returns (uint256 collateral, uint256 debt) {
+        return MakerDaiDelegateLib.getCdpBalances(urn, ilk_yieldBearing);
+    }
+
+    function _getCdpSnapshot() internal view virtual returns (uint256 collateral, uint256 debt, uint256 spotPrice) {
+        return MakerDaiDelegateLib.getCdpSnapshot(urn, ilk_yieldBearing);
+    }
+
+    function _getMakerVaultRatio(uint256 _collateral, uint256 _debt, uint256 _wantPerYieldBearing) internal view virtual returns (uint256) {
+        return MakerDaiDelegateLib.getPessimisticRatio(_collateral, _debt, ilk_yieldBearing, _wantPerYieldBearing, WAD);
+    }
+
+    // Everything a monitoring pass reads, with the G-UNI price and the vat balances read once
+    function getStrategyState() external view returns (StrategyState memory state) {
+        state.cdpId = cdpId;
+        state.urn = urn;
+        state.wantPerYieldBearing = getWantPerYieldBearing();
+        state.balanceOfWant = balanceOfWant();
+        state.balanceOfYieldBearing = balanceOfYieldBearing();
+        uint256 spotPrice;
+        (state.balanceOfMakerVault, state.balanceOfDebt, spotPrice) = _getCdpSnapshot();
+        if (state.balanceOfMakerVault > 0) {
+            state.currentMakerVaultRatio = MakerDaiDelegateLib._pessimisticRatio(state.balanceOfMakerVault, state.balanceOfDebt, spotPrice, state.wantPerYieldBearing, WAD);
+        }
+        state.estimatedTotalAssets = state.balanceOfWant
+                .add(state.balanceOfYieldBearing.add(state.balanceOfMakerVault).mul(state.wantPerYieldBearing).div(WAD))
+                .sub(state.balanceOfDebt);
+        state.balanceOfDaiAvailableToMint = balanceOfDaiAvailableToMint();
+        state.undeployedWant = undeployedWant();
+
+        RiskParameters memory params = riskParameters;
+        state.collateralizationRatio = params.collateralizationRatio;
+        state.lowerRebalanceTolerance = params.lowerRebalanceTolerance;
+        state.upperRebalanceTolerance = params.upperRebalanceTolerance;
+        state.minSingleTrade = params.minSingleTrade;
+        state.maxSingleTrade = params.maxSingleTrade;
+        state.creditThreshold = params.creditThreshold;
+        state.yieldBearingApr = params.yieldBearingApr;
+        state.tendHorizon = params.tendHorizon;
+
+        state.tendTrigger = state.balanceOfMakerVault > 0 && _tendTrigger(state.currentMakerVaultRatio, state.balanceOfDebt, 0);
+        state.harvestTrigger = harvestTrigger(0);
     }
 
     function getHypotheticalMakerVaultRatioWithMultiplier(uint256 _wantMultiplier, uint256 _otherTokenMultiplier) public view returns (uint256) {
@@ -462,20 +771,4 @@ contract Strategy is BaseStrategy {
         return IBaseFee(0xb5e1CAcB567d98faaDB60a1fD4820720141f064F).isCurrentBaseFeeAcceptable();
     }
 
-
-    // ----------------- INTERNAL CALCS -----------------
-
-    function _lockCollateralAndMintDai(
-        uint256 collateralAmount,
-        uint256 daiToMint
-    ) internal {
-        MakerDaiDelegateLib.lockGemAndDraw(
-            gemJoinAdapter,
-            cdpId,
-            collateralAmount,
-            daiToMint,
-            balanceOfDebt()
-        );
-    }
-
 }
@@ -0,0 +1,47 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.6.12;
+pragma experimental ABIEncoderV2;
+
+import "./Strategy.sol";
+
+// Build variant of Strategy that compiles the hot cdp views into the strategy itself
+// instead of delegatecalling the linked MakerDaiDelegateLib. tendTrigger, harvest and
+// the vault ratio checks get cheaper at the cost of a larger bytecode.
+// tests/detailedtests/test_inlined_views.py compares size and gas of both variants.
+contract StrategyInlinedViews is Strategy {
+    constructor(
+        address _vault,
+        string memory _strategyName,
+        bytes32 _ilk_yieldBearing,
+        address _gemJoin
+    )
+        public
+        Strategy(
+            _vault,
+            _strategyName,
+            _ilk_yieldBearing,
+            _gemJoin
+        )
+    {}
+
+    function balanceOfDebt() public view override returns (uint256) {
+        return MakerDaiDelegateLib._debtForCdp(urn, ilk_yieldBearing);
+    }
+
+    // Returns collateral balance in the vault
+    function balanceOfMakerVault() public view override returns (uint256) {
+        return MakerDaiDelegateLib._balanceOfCdp(urn, ilk_yieldBearing);
+    }
+
+    function _getCdpBalances() internal view override returns (uint256 collateral, uint256 debt) {
+        return MakerDaiDelegateLib._getCdpBalances(urn, ilk_yieldBearing);
+    }
+
+    function _getCdpSnapshot() internal view override returns (uint256 collateral, uint256 debt, uint256 spotPrice) {
+        return MakerDaiDelegateLib._getCdpSnapshot(urn, ilk_yieldBearing);
+    }
+
+    function _getMakerVaultRatio(uint256 _collateral, uint256 _debt, uint256 _wantPerYieldBearing) internal view override returns (uint256) {
+        return MakerDaiDelegateLib._getPessimisticRatio(_collateral, _debt, ilk_yieldBearing, _wantPerYieldBearing, WAD);
+    }
+}
@@ -10,10 +10,10 @@ import "../interfaces/yearn/IOSMedianizer.sol";
 contract TestStrategy is Strategy {
     constructor(
         address _vault,
-        string memory _strategyName
+        string memory _strategyName,
 //        bytes32 _ilk_want,
-//        bytes32 _ilk_yieldBearing,
-//        address _gemJoin
+        bytes32 _ilk_yieldBearing,
+        address _gemJoin
 //        address _wantToUSDOSMProxy
 //        address _yieldBearingToUSDOSMProxy
 //        address _chainlinkWantToETHPriceFeed
@@ -21,23 +21,23 @@ contract TestStrategy is Strategy {
         public
         Strategy(
             _vault,
-            _strategyName
+            _strategyName,
 //            _ilk_want,
-//            _ilk_yieldBearing,
-//            _gemJoin
+            _ilk_yieldBearing,
+            _gemJoin
 //            _wantToUSDOSMProxy
 //            _yieldBearingToUSDOSMProxy
 //            _chainlinkWantToETHPriceFeed
         )
     {}
-/*
+
     function _liquidatePosition(uint256 _amountNeeded)
         public
         returns (uint256 _liquidatedAmount, uint256 _loss)
     {
         (_liquidatedAmount, _loss) = liquidatePosition(_amountNeeded);
     }
-*/
+
 /*
     function _getWantPrice() public view returns (uint256) {
         return getWantPerYieldBearing();
@@ -23,6 +23,8 @@ interface PSMLike {
     function gemJoin() external view returns (address);
     function sellGem(address usr, uint256 gemAmt) external;
     function buyGem(address usr, uint256 gemAmt) external;
+    function tout() external view returns (uint256);
+    function tin() external view returns (uint256);
 }
 
 interface IERC3156FlashLender {
@@ -59,7 +61,7 @@ library MakerDaiDelegateLib {
 
     //event DebugDelegate(uint256 _number, uint _value);
 
-    enum Action {WIND, UNWIND}
+    enum Action {WIND, UNWIND, UNWIND_PARTIAL}
 
     //uint256 public constant otherTokenTo18Conversion = 10 ** (18 - _otherToken.decimals());
     //Strategy specific addresses:
@@ -72,15 +74,24 @@ library MakerDaiDelegateLib {
     //IERC20 internal constant otherToken = IERC20(0x6B175474E89094C44Da98b954EedeAC495271d0F);
     //uint256 public constant otherTokenTo18Conversion = 1;
 
+    // The G-UNI pool, its ilk and gemJoin are set per strategy and passed in as CdpConfig:
     //GUNIDAIUSDC1 - Gelato Uniswap DAI/USDC LP - 0.05% fee
-    //GUniPool internal constant yieldBearing = GUniPool(0xAbDDAfB225e10B90D798bB8A886238Fb835e2053);
-    //bytes32 internal constant ilk_yieldBearing = 0x47554e49563344414955534443312d4100000000000000000000000000000000;
-    //address internal constant gemJoinAdapter = 0xbFD445A97e7459b0eBb34cfbd3245750Dba4d7a4;
-    
+    //yieldBearing = 0xAbDDAfB225e10B90D798bB8A886238Fb835e2053
+    //ilk_yieldBearing = 0x47554e49563344414955534443312d4100000000000000000000000000000000
+    //gemJoinAdapter = 0xbFD445A97e7459b0eBb34cfbd3245750Dba4d7a4
     //GUNIDAIUSDC2 - Gelato Uniswap DAI/USDC2 LP 2 - 0.01% fee
-    GUniPool internal constant yieldBearing = GUniPool(0x50379f632ca68D36E50cfBC8F78fe16bd1499d1e);
-    bytes32 internal constant ilk_yieldBearing = 0x47554e49563344414955534443322d4100000000000000000000000000000000;
-    address internal constant gemJoinAdapter = 0xA7e4dDde3cBcEf122851A7C8F7A55f23c0Daf335;
+    //yieldBearing = 0x50379f632ca68D36E50cfBC8F78fe16bd1499d1e
+    //ilk_yieldBearing = 0x47554e49563344414955534443322d4100000000000000000000000000000000
+    //gemJoinAdapter = 0xA7e4dDde3cBcEf122851A7C8F7A55f23c0Daf335
+    // urn and collateralTo18Conversion are resolved once when the cdp is opened or shifted
+    struct CdpConfig {
+        uint256 cdpId;
+        bytes32 ilk;
+        address gemJoin;
+        GUniPool yieldBearing;
+        address urn;
+        uint256 collateralTo18Conversion;
+    }
 
     PSMLike public constant psm = PSMLike(0x89B78CfA322F6C5dE0aBcEecab66Aee45393cC5A) ;
 
@@ -99,6 +110,9 @@ library MakerDaiDelegateLib {
     // Maker vaults manager
     ManagerLike internal constant manager = ManagerLike(0x5ef30b9986345249bc32d8928B7ee64DE9435E39);
 
+    // Core accounting of Maker, same as manager.vat()
+    VatLike internal constant vat = VatLike(0x35D1b3F3D7966A1DFe207aa4514C12a259A0492B);
+
     // Token Adapter Module for collateral
     DaiJoinLike internal constant daiJoin = DaiJoinLike(0x9759A6Ac90977b93B58547b4A71c78317f391A28);
 
@@ -116,6 +130,9 @@ library MakerDaiDelegateLib {
     // Creates an UrnHandler (cdp) for a specific ilk and allows to manage it via the internal
     // registry of the manager.
     function openCdp(bytes32 ilk) public returns (uint256) {
+        // Allow access to DAI balance in the vat once, every draw exits through daiJoin
+        vat.hope(address(daiJoin));
+
         return manager.open(ilk, address(this));
     }
 
@@ -124,6 +141,31 @@ library MakerDaiDelegateLib {
         manager.shift(cdpId, newCdpId);
     }
 
+    // Address holding the collateral and debt of cdpId in the vat
+    function urnForCdp(uint256 cdpId) public view returns (address) {
+        return manager.urns(cdpId);
+    }
+
+    // For those collaterals that have less than 18 decimals precision we need to do the conversion before
+    // passing to frob function
+    function getCollateralTo18Conversion(address gemJoin) public view returns (uint256) {
+        return 10**(18 - GemJoinLike(gemJoin).dec());
+    }
+
+    // Approves every fixed spender the strategy pays once with an infinite allowance:
+    // flashmint and daiJoin pull DAI, the PSM pulls DAI on buyGem and its gemJoin USDC
+    // on sellGem, the G-UNI pool pulls both on mint and the gemJoin the G-UNI tokens.
+    // Resets to 0 first so it can also be used to top up allowances that were spent down
+    function approveSpenders(GUniPool yieldBearing, address gemJoin) public {
+        _approveMax(borrowToken, address(flashmint));
+        _approveMax(borrowToken, address(daiJoin));
+        _approveMax(want, address(psm));
+        _approveMax(otherToken, psm.gemJoin());
+        _approveMax(want, address(yieldBearing));
+        _approveMax(otherToken, address(yieldBearing));
+        _approveMax(IERC20(address(yieldBearing)), gemJoin);
+    }
+
     // Transfers the ownership of cdp to recipient address in the manager registry.
     function transferCdp(uint256 cdpId, address recipient) public {
         manager.give(cdpId, recipient);
@@ -140,37 +182,29 @@ library MakerDaiDelegateLib {
 
     // Deposits collateral (gem) and mints DAI
     function lockGemAndDraw(
-        address gemJoin,
-        uint256 cdpId,
+        CdpConfig memory cdp,
         uint256 collateralAmount,
         uint256 daiToMint,
         uint256 totalDebt
     ) public {
-        address urn = manager.urns(cdpId);
-        VatLike vat = VatLike(manager.vat());
-        bytes32 ilk = manager.ilks(cdpId);
-
         if (daiToMint > 0) {
-            daiToMint = _forceMintWithinLimits(vat, ilk, daiToMint, totalDebt);
+            daiToMint = _forceMintWithinLimits(cdp.ilk, daiToMint, totalDebt);
         }
 
         // Takes token amount from the strategy and joins into the vat
         if (collateralAmount > 0) {
-            GemJoinLike(gemJoin).join(urn, collateralAmount);
+            GemJoinLike(cdp.gemJoin).join(cdp.urn, collateralAmount);
         }
 
         // Locks token amount into the CDP and generates debt
         manager.frob(
-            cdpId,
-            int256(convertTo18(gemJoin, collateralAmount)),
-            _getDrawDart(vat, urn, ilk, daiToMint)
+            cdp.cdpId,
+            int256(collateralAmount.mul(cdp.collateralTo18Conversion)),
+            _getDrawDart(cdp.urn, cdp.ilk, daiToMint)
         );
 
         // Moves the DAI amount to the strategy. Need to convert dai from [wad] to [rad]
-        manager.move(cdpId, address(this), daiToMint.mul(1e27));
-
-        // Allow access to DAI balance in the vat
-        vat.hope(address(daiJoin));
+        manager.move(cdp.cdpId, address(this), daiToMint.mul(1e27));
 
         // Exits DAI to the user's wallet as a token
         daiJoin.exit(address(this), daiToMint);
@@ -178,37 +212,27 @@ library MakerDaiDelegateLib {
 
     // Returns DAI to decrease debt and attempts to unlock any amount of collateral
     function wipeAndFreeGem(
-        address gemJoin,
-        uint256 cdpId,
+        CdpConfig memory cdp,
         uint256 collateralAmount,
         uint256 daiToRepay
     ) public {
-        address urn = manager.urns(cdpId);
-
         // Joins DAI amount into the vat
         if (daiToRepay > 0) {
-            daiJoin.join(urn, daiToRepay);
+            daiJoin.join(cdp.urn, daiToRepay);
         }
 
-        uint256 wadC = convertTo18(gemJoin, collateralAmount);
-
         // Paybacks debt to the CDP and unlocks token amount from it
         manager.frob(
-            cdpId,
-            -int256(wadC),
-            _getWipeDart(
-                VatLike(manager.vat()),
-                VatLike(manager.vat()).dai(urn),
-                urn,
-                manager.ilks(cdpId)
-            )
+            cdp.cdpId,
+            -int256(collateralAmount.mul(cdp.collateralTo18Conversion)),
+            _getWipeDart(vat.dai(cdp.urn), cdp.urn, cdp.ilk)
         );
 
         // Moves the amount from the CDP urn to proxy's address
-        manager.flux(cdpId, address(this), collateralAmount);
+        manager.flux(cdp.cdpId, address(this), collateralAmount);
 
         // Exits token amount to the strategy as a token
-        GemJoinLike(gemJoin).exit(address(this), collateralAmount);
+        GemJoinLike(cdp.gemJoin).exit(address(this), collateralAmount);
     }
 
     function debtFloor(bytes32 ilk) public view returns (uint256) {
@@ -217,18 +241,113 @@ library MakerDaiDelegateLib {
         // uint256 spot;  // Price with Safety Margin  [ray]
         // uint256 line;  // Debt Ceiling              [rad]
         // uint256 dust;  // Urn Debt Floor            [rad]
-        (, , , , uint256 dust) = VatLike(manager.vat()).ilks(ilk);
+        (, , , , uint256 dust) = vat.ilks(ilk);
         return dust.div(RAY);
     }
 
-    function debtForCdp(uint256 cdpId, bytes32 ilk)
+    // The cdp views below are public for the delegatecalling Strategy and have internal
+    // twins that StrategyInlinedViews compiles into its own bytecode for the hot read paths
+
+    function debtForCdp(address urn, bytes32 ilk)
+        public
+        view
+        returns (uint256)
+    {
+        return _debtForCdp(urn, ilk);
+    }
+
+    function balanceOfCdp(address urn, bytes32 ilk)
         public
         view
         returns (uint256)
     {
-        address urn = manager.urns(cdpId);
-        VatLike vat = VatLike(manager.vat());
+        return _balanceOfCdp(urn, ilk);
+    }
+
+    // Returns value of DAI in the reference asset (e.g. $1 per DAI)
+    function getDaiPar() public view returns (uint256) {
+        // Value is returned in ray (10**27)
+        return spotter.par();
+    }
 
+    // Liquidation ratio for the given ilk returned in [ray]
+    function getLiquidationRatio(bytes32 ilk) public view returns (uint256) {
+        return _getLiquidationRatio(ilk);
+    }
+
+    function getSpotPrice(bytes32 ilk) public view returns (uint256) {
+        return _getSpotPrice(ilk);
+    }
+
+    function getPessimisticRatioOfCdpWithExternalPrice(
+        address urn,
+        bytes32 ilk,
+        uint256 externalPrice,
+        uint256 collateralizationRatioPrecision
+    ) public view returns (uint256) {
+        return _getPessimisticRatioOfCdpWithExternalPrice(urn, ilk, externalPrice, collateralizationRatioPrecision);
+    }
+
+    // Same ratio for collateral and debt balances the caller already read
+    function getPessimisticRatio(
+        uint256 collateralBalance,
+        uint256 totalDebt,
+        bytes32 ilk,
+        uint256 externalPrice,
+        uint256 collateralizationRatioPrecision
+    ) public view returns (uint256) {
+        return _getPessimisticRatio(collateralBalance, totalDebt, ilk, externalPrice, collateralizationRatioPrecision);
+    }
+
+    // Collateral and debt of the cdp with a single read of the urn and the ilk
+    function getCdpBalances(address urn, bytes32 ilk)
+        public
+        view
+        returns (uint256 collateral, uint256 debt)
+    {
+        return _getCdpBalances(urn, ilk);
+    }
+
+    function _getCdpBalances(address urn, bytes32 ilk)
+        internal
+        view
+        returns (uint256 collateral, uint256 debt)
+    {
+        (uint256 ink, uint256 art) = vat.urns(ilk, urn);
+        (, uint256 rate, , , ) = vat.ilks(ilk);
+        return (ink, art.mul(rate).div(RAY));
+    }
+
+    // Collateral, debt and spot price of the cdp with a single read of the urn and the ilk.
+    // spotPrice is 0 when there is no collateral to price
+    function getCdpSnapshot(address urn, bytes32 ilk)
+        public
+        view
+        returns (uint256 collateral, uint256 debt, uint256 spotPrice)
+    {
+        return _getCdpSnapshot(urn, ilk);
+    }
+
+    function _getCdpSnapshot(address urn, bytes32 ilk)
+        internal
+        view
+        returns (uint256 collateral, uint256 debt, uint256 spotPrice)
+    {
+        (uint256 ink, uint256 art) = vat.urns(ilk, urn);
+        (, uint256 rate, uint256 spot, , ) = vat.ilks(ilk);
+
+        collateral = ink;
+        debt = art.mul(rate).div(RAY);
+        if (ink > 0) {
+            spotPrice = spot.mul(_getLiquidationRatio(ilk)).div(RAY * 1e9);
+        }
+    }
+
+    function _debtForCdp(address urn, bytes32 ilk)
+        internal
+        view
+        returns (uint256)
+    {
         // Normalized outstanding stablecoin debt [wad]
         (, uint256 art) = vat.urns(ilk, urn);
 
@@ -239,54 +358,61 @@ library MakerDaiDelegateLib {
         return art.mul(rate).div(RAY);
     }
 
-    function balanceOfCdp(uint256 cdpId, bytes32 ilk)
-        public
+    function _balanceOfCdp(address urn, bytes32 ilk)
+        internal
         view
         returns (uint256)
     {
-        address urn = manager.urns(cdpId);
-        VatLike vat = VatLike(manager.vat());
-
         (uint256 ink, ) = vat.urns(ilk, urn);
         return ink;
     }
 
-    // Returns value of DAI in the reference asset (e.g. $1 per DAI)
-    function getDaiPar() public view returns (uint256) {
-        // Value is returned in ray (10**27)
-        return spotter.par();
-    }
-
-    // Liquidation ratio for the given ilk returned in [ray]
-    function getLiquidationRatio(bytes32 ilk) public view returns (uint256) {
+    function _getLiquidationRatio(bytes32 ilk) internal view returns (uint256) {
         (, uint256 liquidationRatio) = spotter.ilks(ilk);
         return liquidationRatio;
     }
 
-    function getSpotPrice(bytes32 ilk) public view returns (uint256) {
-        VatLike vat = VatLike(manager.vat());
-
+    function _getSpotPrice(bytes32 ilk) internal view returns (uint256) {
         // spot: collateral price with safety margin returned in [ray]
         (, , uint256 spot, , ) = vat.ilks(ilk);
 
-        uint256 liquidationRatio = getLiquidationRatio(ilk);
+        uint256 liquidationRatio = _getLiquidationRatio(ilk);
 
         // convert ray*ray to wad
         return spot.mul(liquidationRatio).div(RAY * 1e9);
     }
 
-    function getPessimisticRatioOfCdpWithExternalPrice(
-        uint256 cdpId,
+    function _getPessimisticRatioOfCdpWithExternalPrice(
+        address urn,
         bytes32 ilk,
         uint256 externalPrice,
         uint256 collateralizationRatioPrecision
-    ) public view returns (uint256) {
+    ) internal view returns (uint256) {
+        return _getPessimisticRatio(_balanceOfCdp(urn, ilk), _debtForCdp(urn, ilk), ilk, externalPrice, collateralizationRatioPrecision);
+    }
+
+    function _getPessimisticRatio(
+        uint256 collateralBalance,
+        uint256 totalDebt,
+        bytes32 ilk,
+        uint256 externalPrice,
+        uint256 collateralizationRatioPrecision
+    ) internal view returns (uint256) {
+        return _pessimisticRatio(collateralBalance, totalDebt, _getSpotPrice(ilk), externalPrice, collateralizationRatioPrecision);
+    }
+
+    function _pessimisticRatio(
+        uint256 collateralBalance,
+        uint256 totalDebt,
+        uint256 spotPrice,
+        uint256 externalPrice,
+        uint256 collateralizationRatioPrecision
+    ) internal pure returns (uint256) {
         // Use pessimistic price to determine the worst ratio possible
-        uint256 price = Math.min(getSpotPrice(ilk), externalPrice);
+        uint256 price = Math.min(spotPrice, externalPrice);
         require(price > 0); // dev: invalid price
 
-        uint256 totalCollateralValue = balanceOfCdp(cdpId, ilk).mul(price).div(WAD);
-        uint256 totalDebt = debtForCdp(cdpId, ilk);
+        uint256 totalCollateralValue = collateralBalance.mul(price).div(WAD);
 
         // If for some reason we do not have debt (e.g: deposits under dust)
         // make sure the operation does not revert
@@ -307,6 +433,12 @@ library MakerDaiDelegateLib {
         autoLine.exec(ilk);
     }
 
+    // Yearly stability fee of the ilk in [wad], linear in the per-second rate
+    function getStabilityFeeApr(bytes32 ilk) public view returns (uint256) {
+        (uint256 duty, ) = jug.ilks(ilk);
+        return duty.add(jug.base()).sub(RAY).mul(365 days).div(1e9);
+    }
+
     function daiJoinAddress() public view returns (address) {
         return address(daiJoin);
     }
@@ -319,7 +451,6 @@ library MakerDaiDelegateLib {
     
     // Checks amount of Dai mintable
     function balanceOfDaiAvailableToMint(bytes32 ilk) public view returns (uint256) {
-        VatLike vat = VatLike(manager.vat());
         (uint256 Art, uint256 rate, , uint256 line, ) = vat.ilks(ilk);
 
         // Total debt in [rad] (wad * ray)
@@ -335,103 +466,211 @@ library MakerDaiDelegateLib {
     function wind(
         uint256 wantAmountInitial,
         uint256 targetCollateralizationRatio,
-        uint256 cdpId
+        CdpConfig memory cdp
     ) public {
         wantAmountInitial = Math.min(wantAmountInitial, balanceOfWant());
         //Calculate how much borrowToken to mint to leverage up to targetCollateralizationRatio:
         uint256 flashloanAmount = wantAmountInitial.mul(RAY).div(targetCollateralizationRatio.mul(1e9).sub(RAY));
-        VatLike vat = VatLike(manager.vat());
-        uint256 currentDebt = debtForCdp(cdpId, ilk_yieldBearing);
-        flashloanAmount = Math.min(flashloanAmount, _forceMintWithinLimits(vat, ilk_yieldBearing, flashloanAmount, currentDebt));
+        uint256 currentDebt = debtForCdp(cdp.urn, cdp.ilk);
+        flashloanAmount = Math.min(flashloanAmount, _forceMintWithinLimits(cdp.ilk, flashloanAmount, currentDebt));
         //Check if amount of dai to borrow is above debtFloor
-        if ( (currentDebt.add(flashloanAmount)) <= debtFloor(ilk_yieldBearing).add(1e15)){
+        if ( (currentDebt.add(flashloanAmount)) <= debtFloor(cdp.ilk).add(1e15)){
             return;
         }
-        bytes memory data = abi.encode(Action.WIND, cdpId, wantAmountInitial, flashloanAmount, targetCollateralizationRatio); 
+        //Winding does not need the G-UNI price, the last field is only used when unwinding
+        bytes memory data = abi.encode(Action.WIND, wantAmountInitial, flashloanAmount, targetCollateralizationRatio, 0); 
         _initFlashLoan(data, flashloanAmount);
     }
     
+    // Levers an over-collateralized cdp back to targetCollateralizationRatio with a single flashmint and frob:
+    // (C*p + W + F) / (D + F) = r  -->  F = (C*p + W - r*D) / (r - 1)
+    function releverage(
+        uint256 wantAmountInitial,
+        uint256 targetCollateralizationRatio,
+        uint256 wantPerYieldBearing,
+        CdpConfig memory cdp
+    ) public {
+        wantAmountInitial = Math.min(wantAmountInitial, balanceOfWant());
+        uint256 currentDebt = debtForCdp(cdp.urn, cdp.ilk);
+        //Collateral is priced pessimistically, like unwind and the strategy's rebalance band
+        uint256 collateralAndWantValue = balanceOfCdp(cdp.urn, cdp.ilk).mul(Math.min(_getSpotPrice(cdp.ilk), wantPerYieldBearing)).div(WAD).add(wantAmountInitial);
+        uint256 targetDebtValue = currentDebt.mul(targetCollateralizationRatio).div(WAD);
+        if (collateralAndWantValue <= targetDebtValue) {
+            return;
+        }
+        uint256 flashloanAmount = collateralAndWantValue.sub(targetDebtValue).mul(WAD).div(targetCollateralizationRatio.sub(WAD));
+        flashloanAmount = Math.min(flashloanAmount, _forceMintWithinLimits(cdp.ilk, flashloanAmount, currentDebt));
+        //Check if amount of dai to borrow is above debtFloor
+        if ( (currentDebt.add(flashloanAmount)) <= debtFloor(cdp.ilk).add(1e15)){
+            return;
+        }
+        //The WIND callback locks the flashmint and the loose want as collateral and draws the flashmint back in one frob
+        bytes memory data = abi.encode(Action.WIND, wantAmountInitial, flashloanAmount, targetCollateralizationRatio, wantPerYieldBearing);
+        _initFlashLoan(data, flashloanAmount);
+    }
+
     function unwind(
         uint256 wantAmountRequested,
         uint256 targetCollateralizationRatio,
-        uint256 cdpId
+        uint256 wantPerYieldBearing,
+        CdpConfig memory cdp
+    ) public {
+        uint256 currentCollateral = balanceOfCdp(cdp.urn, cdp.ilk);
+        if (currentCollateral == 0){
+            return;
+        }
+        uint256 currentDebt = debtForCdp(cdp.urn, cdp.ilk);
+        //Flashmint only what is needed to stay at targetCollateralizationRatio after freeing wantAmountRequested.
+        //The ratio is measured at the pessimistic price, like the strategy's rebalance band
+        uint256 flashloanAmount = _getPartialUnwindFlashloanAmount(
+            wantAmountRequested,
+            targetCollateralizationRatio,
+            currentCollateral.mul(Math.min(_getSpotPrice(cdp.ilk), wantPerYieldBearing)).div(WAD),
+            currentDebt
+        );
+        uint256 yieldBearingToFree = _yieldBearingToRaise(flashloanAmount.add(wantAmountRequested), wantPerYieldBearing);
+        bytes memory data;
+        //Partial path only if the remaining debt stays above debtFloor, otherwise pay off the full debt
+        if (flashloanAmount < currentDebt && currentDebt.sub(flashloanAmount) > debtFloor(cdp.ilk).add(1e15) && yieldBearingToFree < currentCollateral) {
+            if (flashloanAmount == 0) {
+                //Enough collateral to free wantAmountRequested without repaying debt
+                if (yieldBearingToFree > 0) {
+                    wipeAndFreeGem(cdp, yieldBearingToFree, 0);
+                    _swapYieldBearingToWant(cdp.yieldBearing, yieldBearingToFree);
+                }
+                return;
+            }
+            data = abi.encode(Action.UNWIND_PARTIAL, wantAmountRequested, flashloanAmount, targetCollateralizationRatio, wantPerYieldBearing);
+        } else {
+            //Paying off the full debt it's common to experience Vat/dust reverts: we circumvent this with add 1 Wei to the amount to be paid
+            flashloanAmount = currentDebt.add(1);
+            //Below the target the re-draw alone can not repay the flashmint, burn enough to cover the rest
+            wantAmountRequested = Math.max(
+                wantAmountRequested,
+                _getFullUnwindMinimumRequest(currentCollateral, flashloanAmount, targetCollateralizationRatio, wantPerYieldBearing)
+            );
+            data = abi.encode(Action.UNWIND, wantAmountRequested, flashloanAmount, targetCollateralizationRatio, wantPerYieldBearing);
+        }
+        _initFlashLoan(data, flashloanAmount);
+    }
+
+    // Fast path to a safer ratio: repays debtShare [wad] of the debt in one partial flashmint and
+    // frees only the collateral that pays it back. No hygiene calls, nothing is re-locked
+    function emergencyDeleverage(
+        uint256 debtShare,
+        uint256 wantPerYieldBearing,
+        CdpConfig memory cdp
     ) public {
-        if (balanceOfCdp(cdpId, ilk_yieldBearing) == 0){
+        uint256 currentDebt = _debtForCdp(cdp.urn, cdp.ilk);
+        if (currentDebt == 0) {
             return;
         }
-        //Paying off the full debt it's common to experience Vat/dust reverts: we circumvent this with add 1 Wei to the amount to be paid
-        uint256 flashloanAmount = debtForCdp(cdpId, ilk_yieldBearing).add(1);
-        bytes memory data = abi.encode(Action.UNWIND, cdpId, wantAmountRequested, flashloanAmount, targetCollateralizationRatio);
-        //Always flashloan entire debt to pay off entire debt:
+        uint256 flashloanAmount = currentDebt.mul(debtShare).div(WAD);
+        //Debt left under debtFloor would revert with Vat/dust, pay off the full debt instead
+        if (flashloanAmount >= currentDebt || currentDebt.sub(flashloanAmount) <= debtFloor(cdp.ilk).add(1e15)) {
+            flashloanAmount = currentDebt.add(1);
+        }
+        bytes memory data = abi.encode(Action.UNWIND_PARTIAL, 0, flashloanAmount, 0, wantPerYieldBearing);
         _initFlashLoan(data, flashloanAmount);
     }
 
-    function _wind(uint256 cdpId, uint256 flashloanRepayAmount, uint256 wantAmountInitial, uint256) public {
+    // The flashmint callbacks return the G-UNI amount locked or burned and the PSM volume in [wad]
+    // so the strategy can report them in its Wind and Unwind events
+    function _wind(CdpConfig memory cdp, uint256 flashloanRepayAmount, uint256 wantAmountInitial, uint256) public returns (uint256 yieldBearingAmountToLock, uint256 psmVolume) {
         //repayAmount includes any fees
-        uint256 yieldBearingAmountToLock = _swapWantToYieldBearing(balanceOfWant());
-        //Check allowance to lock collateral 
-        _checkAllowance(gemJoinAdapter, address(yieldBearing), yieldBearingAmountToLock);
+        //Only the chunk being wound and the flashmint are swapped, any other loose want stays for the next chunk or the vault
+        (yieldBearingAmountToLock, psmVolume) = _swapWantToYieldBearing(cdp.yieldBearing, wantAmountInitial.add(flashloanRepayAmount));
         //Lock collateral and borrow dai to repay flashmint
         lockGemAndDraw(
-            gemJoinAdapter,
-            cdpId,
+            cdp,
             yieldBearingAmountToLock,
             flashloanRepayAmount,
-            debtForCdp(cdpId, ilk_yieldBearing)
+            debtForCdp(cdp.urn, cdp.ilk)
         );
     }
 
-    function _unwind(uint256 cdpId, uint256 flashloanRepayAmount, uint256 wantAmountRequested, uint256 targetCollateralizationRatio) public {
-        //Repay entire debt, to then take debt again later:
-        //Check allowance for repaying borrowToken Debt
-        uint256 currentDebtPlusRounding = debtForCdp(cdpId, ilk_yieldBearing).add(1);
-        _checkAllowance(daiJoinAddress(), address(borrowToken), currentDebtPlusRounding);
-        wipeAndFreeGem(gemJoinAdapter, cdpId, balanceOfCdp(cdpId, ilk_yieldBearing), currentDebtPlusRounding);
-        //All debt paid down, collateral unlocked
-        //Calculate leverage+1 to know how much totalRequestedInYieldBearing to swap for borrowToken
-        uint256 leveragePlusOne = (RAY.mul(WAD).div((targetCollateralizationRatio.mul(1e9).sub(RAY)))).add(WAD);
-        uint256 totalRequestedInYieldBearing = wantAmountRequested.mul(leveragePlusOne).div(getWantPerYieldBearing());
-        //Maximum of all yieldBearing can be requested
-        totalRequestedInYieldBearing = Math.min(totalRequestedInYieldBearing, balanceOfYieldBearing());
+    function _unwind(CdpConfig memory cdp, uint256 flashloanRepayAmount, uint256 wantAmountRequested, uint256 targetCollateralizationRatio, uint256 wantPerYieldBearing) public returns (uint256 yieldBearingBurned, uint256 psmVolume) {
+        {
+            //Repay entire debt, to then take debt again later:
+            uint256 currentDebtPlusRounding = debtForCdp(cdp.urn, cdp.ilk).add(1);
+            wipeAndFreeGem(cdp, balanceOfCdp(cdp.urn, cdp.ilk), currentDebtPlusRounding);
+        }
+        {
+            //All debt paid down, collateral unlocked
+            //Calculate leverage+1 to know how much totalRequestedInYieldBearing to swap for borrowToken
+            uint256 leveragePlusOne = (RAY.mul(WAD).div((targetCollateralizationRatio.mul(1e9).sub(RAY)))).add(WAD);
+            uint256 totalRequestedInYieldBearing = wantAmountRequested.mul(leveragePlusOne).div(wantPerYieldBearing);
+            //Maximum of all yieldBearing can be requested
+            yieldBearingBurned = Math.min(totalRequestedInYieldBearing, balanceOfYieldBearing(cdp.yieldBearing));
         
-        _swapYieldBearingToWant(totalRequestedInYieldBearing);
-        //Want amount requested now in wallet
+            psmVolume = _swapYieldBearingToWant(cdp.yieldBearing, yieldBearingBurned);
+            //Want amount requested now in wallet
+        }
 
         //Lock collateral and borrow dai equivalent to amount given by targetCollateralizationRatio:
-        uint256 yieldBearingBalance = balanceOfYieldBearing();
-        uint256 borrowTokenAmountToMint = yieldBearingBalance.mul(getWantPerYieldBearing()).div(targetCollateralizationRatio);
+        uint256 yieldBearingBalance = balanceOfYieldBearing(cdp.yieldBearing);
+        uint256 borrowTokenAmountToMint = yieldBearingBalance.mul(wantPerYieldBearing).div(targetCollateralizationRatio);
         //Check if amount of dai to borrow is above debtFloor. If not, swap everything to want and return.
-        if ( borrowTokenAmountToMint <= debtFloor(ilk_yieldBearing).add(1e15)){
-            _swapYieldBearingToWant(balanceOfYieldBearing());
-            yieldBearingBalance = balanceOfYieldBearing();
-            return;
+        if ( borrowTokenAmountToMint <= debtFloor(cdp.ilk).add(1e15)){
+            yieldBearingBurned = yieldBearingBurned.add(yieldBearingBalance);
+            psmVolume = psmVolume.add(_swapYieldBearingToWant(cdp.yieldBearing, yieldBearingBalance));
+            return (yieldBearingBurned, psmVolume);
         }
         //Make sure to always mint enough to repay the flashloan
         borrowTokenAmountToMint = Math.min(borrowTokenAmountToMint, flashloanRepayAmount);
-        //Check allowance to lock collateral 
-        _checkAllowance(gemJoinAdapter, address(yieldBearing), yieldBearingBalance);
         //Lock collateral and mint dai to repay flashmint
         lockGemAndDraw(
-            gemJoinAdapter,
-            cdpId,
+            cdp,
             yieldBearingBalance,
             borrowTokenAmountToMint,
-            debtForCdp(cdpId, ilk_yieldBearing)
+            debtForCdp(cdp.urn, cdp.ilk)
         );
         //want=dai: nothing further necessary
     }
 
-    //get amount of Want in Wei that is received for 1 yieldBearing
-    function getWantPerYieldBearing() internal view returns (uint256){
-        (uint256 wantUnderlyingBalance, uint256 otherTokenUnderlyingBalance) = yieldBearing.getUnderlyingBalances();
-        return (wantUnderlyingBalance.mul(WAD).add(otherTokenUnderlyingBalance.mul(WAD).mul(WAD).div(1e6))).div(yieldBearing.totalSupply());
+    function _unwindPartial(CdpConfig memory cdp, uint256 flashloanRepayAmount, uint256 wantAmountRequested, uint256, uint256 wantPerYieldBearing) public returns (uint256 yieldBearingToFree, uint256 psmVolume) {
+        //Repay only the flashminted debt and free the collateral worth flashloan + wantAmountRequested in a single frob
+        yieldBearingToFree = Math.min(
+            _yieldBearingToRaise(flashloanRepayAmount.add(wantAmountRequested), wantPerYieldBearing),
+            balanceOfCdp(cdp.urn, cdp.ilk)
+        );
+        wipeAndFreeGem(cdp, yieldBearingToFree, flashloanRepayAmount);
+        //Burn the freed collateral: flashloan repayment plus want amount requested now in wallet, nothing is re-locked
+        psmVolume = _swapYieldBearingToWant(cdp.yieldBearing, yieldBearingToFree);
+    }
+
+    // The full unwind re-locks what it does not burn and re-draws at targetCollateralizationRatio:
+    // requesting W burns W * r / (r - 1) and re-draws C*p / r - W / (r - 1), together C*p / r + W.
+    // Returns the W that makes this cover flashloanAmount, grossed up for tin on what is burned
+    function _getFullUnwindMinimumRequest(
+        uint256 collateral,
+        uint256 flashloanAmount,
+        uint256 targetCollateralizationRatio,
+        uint256 wantPerYieldBearing
+    ) internal view returns (uint256) {
+        uint256 redrawValue = collateral.mul(wantPerYieldBearing).div(targetCollateralizationRatio);
+        if (redrawValue >= flashloanAmount) {
+            return 0;
+        }
+        uint256 leveragePlusOne = targetCollateralizationRatio.mul(WAD).div(targetCollateralizationRatio.sub(WAD));
+        uint256 tinOnBurn = psm.tin().mul(leveragePlusOne).div(WAD);
+        return flashloanAmount.sub(redrawValue).mul(WAD).div(WAD.sub(tinOnBurn)).add(1e15);
+    }
+
+    // G-UNI to burn so that the burn raises at least wantAmount: sellGem pays out the USDC side
+    // less tin and the burn rounds both sides down, so gross up for tin and add a rounding margin
+    function _yieldBearingToRaise(uint256 wantAmount, uint256 wantPerYieldBearing) internal view returns (uint256) {
+        if (wantAmount == 0) {
+            return 0;
+        }
+        return wantAmount.mul(WAD).div(WAD.sub(psm.tin())).add(1e15).mul(WAD).div(wantPerYieldBearing);
     }
 
     function balanceOfWant() internal view returns (uint256) {
         return want.balanceOf(address(this));
     }
 
-    function balanceOfYieldBearing() internal view returns (uint256) {
+    function balanceOfYieldBearing(GUniPool yieldBearing) internal view returns (uint256) {
         return yieldBearing.balanceOf(address(this));
     }
 
@@ -443,65 +682,68 @@ library MakerDaiDelegateLib {
 
         function _initFlashLoan(bytes memory data, uint256 amount) internal {
         //Flashmint implementation:
-        _checkAllowance(address(flashmint), address(borrowToken), amount);
         flashmint.flashLoan(address(this), address(borrowToken), amount, data);
     }
 
-    function _checkAllowance(
-        address _contract,
-        address _token,
-        uint256 _amount
-    ) internal {
-        if (IERC20(_token).allowance(address(this), _contract) < _amount) {
-            //IERC20(_token).safeApprove(_contract, 0);
-            IERC20(_token).safeApprove(_contract, type(uint256).max);
-        }
+    function _approveMax(IERC20 _token, address _spender) internal {
+        _token.safeApprove(_spender, 0);
+        _token.safeApprove(_spender, type(uint256).max);
     }
 
-    function _swapWantToYieldBearing(uint256 _amount) internal returns (uint256) {
+    // Returns the yieldBearing balance after minting and the volume swapped in the PSM in [wad]
+    function _swapWantToYieldBearing(GUniPool yieldBearing, uint256 _amount) internal returns (uint256, uint256) {
         if (_amount == 0) {
-            return 0;
+            return (0, 0);
         }
         _amount = Math.min(_amount, balanceOfWant());
-        (uint256 wantRatio, uint256 otherTokenRatio) = yieldBearing.getUnderlyingBalances();
-        wantRatio = wantRatio.mul(WAD).div(yieldBearing.totalSupply());
-        otherTokenRatio = otherTokenRatio.mul(WAD).mul(otherTokenTo18Conversion).div(yieldBearing.totalSupply());
-        uint256 wantAmountForMint = _amount.mul(wantRatio).div(wantRatio + otherTokenRatio);
-        uint256 wantAmountToSwapToOtherTokenForMint = _amount.mul(otherTokenRatio).div(wantRatio + otherTokenRatio);
-        //Swap through PSM wantAmountToSwapToOtherTokenForMint --> otherToken
-        _checkAllowance(address(psm), address(want), wantAmountToSwapToOtherTokenForMint);
-        psm.buyGem(address(this), wantAmountToSwapToOtherTokenForMint.div(otherTokenTo18Conversion));
-        
-        //Mint yieldBearing:
+        uint256 psmVolume;
+        uint256 wantAmountForMint;
+        {
+            //Split by the pool's underlying balances, totalSupply cancels out of the ratio
+            (uint256 wantRatio, uint256 otherTokenRatio) = yieldBearing.getUnderlyingBalances();
+            otherTokenRatio = otherTokenRatio.mul(otherTokenTo18Conversion);
+            //buyGem charges tout on top of the otherToken bought, so spending x want leaves
+            //_amount - x want next to x / (1 + tout) otherToken. Solving for the pool ratio:
+            //(_amount - x) / (x / (1 + tout)) = wantRatio / otherTokenRatio
+            uint256 tout = psm.tout();
+            uint256 otherTokenToBuy = _amount.mul(otherTokenRatio).mul(WAD).div(otherTokenRatio.mul(WAD.add(tout)).add(wantRatio.mul(WAD))).div(otherTokenTo18Conversion);
+            //Swap through PSM want --> otherToken
+            psm.buyGem(address(this), otherTokenToBuy);
+            psmVolume = otherTokenToBuy.mul(otherTokenTo18Conversion);
+            wantAmountForMint = _amount.sub(psmVolume.mul(WAD.add(tout)).div(WAD));
+        }
+        //Mint yieldBearing with everything on both sides:
         wantAmountForMint = Math.min(wantAmountForMint, balanceOfWant());
-        uint256 otherTokenBalance = balanceOfOtherToken();
-        _checkAllowance(address(yieldBearing), address(want), wantAmountForMint);
-        _checkAllowance(address(yieldBearing), address(otherToken), otherTokenBalance);      
-        (,,uint256 mintAmount) = yieldBearing.getMintAmounts(wantAmountForMint, otherTokenBalance); 
+        (,,uint256 mintAmount) = yieldBearing.getMintAmounts(wantAmountForMint, balanceOfOtherToken());
         yieldBearing.mint(mintAmount, address(this));
-        return balanceOfYieldBearing();
+        //Rounding leftovers of otherToken go back to want instead of idling until the next wind
+        uint256 otherTokenLeft = balanceOfOtherToken();
+        if (otherTokenLeft > 0) {
+            psm.sellGem(address(this), otherTokenLeft);
+            psmVolume = psmVolume.add(otherTokenLeft.mul(otherTokenTo18Conversion));
+        }
+        return (balanceOfYieldBearing(yieldBearing), psmVolume);
     }
 
-    function _swapYieldBearingToWant(uint256 _amount) internal {
+    // Returns the otherToken amount sold in the PSM in [wad]
+    function _swapYieldBearingToWant(GUniPool yieldBearing, uint256 _amount) internal returns (uint256) {
         if (_amount == 0) {
-            return;
+            return 0;
         }
         //Burn the yieldBearing token to unlock DAI and USDC:
-        yieldBearing.burn(Math.min(_amount, balanceOfYieldBearing()), address(this));
+        yieldBearing.burn(Math.min(_amount, balanceOfYieldBearing(yieldBearing)), address(this));
         
         //Amount of otherToken after burning:
         uint256 otherTokenBalance = balanceOfOtherToken();
 
         //Swap through PSM otherToken ---> Want:
-        address psmGemJoin = psm.gemJoin();
-        _checkAllowance(psmGemJoin, address(otherToken), otherTokenBalance);
         psm.sellGem(address(this), otherTokenBalance);
+        return otherTokenBalance.mul(otherTokenTo18Conversion);
     }
 
     // This function repeats some code from daiAvailableToMint because it needs
     // to handle special cases such as not leaving debt under dust
     function _forceMintWithinLimits(
-        VatLike vat,
         bytes32 ilk,
         uint256 desiredAmount,
         uint256 debtBalance
@@ -539,14 +781,30 @@ library MakerDaiDelegateLib {
         return Math.min(maxMintableDAI, desiredAmount);
     }
 
+    // Debt to repay so that freeing its value plus wantAmountRequested leaves the cdp at the target ratio:
+    // (C*p - F - W) / (D - F) = r  -->  F = (W + r*D - C*p) / (r - 1)
+    function _getPartialUnwindFlashloanAmount(
+        uint256 wantAmountRequested,
+        uint256 targetCollateralizationRatio,
+        uint256 collateralValue,
+        uint256 currentDebt
+    ) internal pure returns (uint256) {
+        uint256 debtAndRequestedValue = wantAmountRequested.add(currentDebt.mul(targetCollateralizationRatio).div(WAD));
+        if (debtAndRequestedValue <= collateralValue) {
+            return 0;
+        }
+        return debtAndRequestedValue.sub(collateralValue).mul(WAD).div(targetCollateralizationRatio.sub(WAD));
+    }
+
     function _getDrawDart(
-        VatLike vat,
         address urn,
         bytes32 ilk,
         uint256 wad
-    ) internal returns (int256 dart) {
-        // Updates stability fee rate
-        uint256 rate = jug.drip(ilk);
+    ) internal view returns (int256 dart) {
+        // frob accounts the debt at the vat rate, which keepBasicMakerHygiene already
+        // dripped when adjusting the position. Dripping again here would be a second
+        // state-changing call into the jug for the same block
+        (, uint256 rate, , , ) = vat.ilks(ilk);
 
         // Gets DAI balance of the urn in the vat
         uint256 dai = vat.dai(urn);
@@ -561,7 +819,6 @@ library MakerDaiDelegateLib {
     }
 
     function _getWipeDart(
-        VatLike vat,
         uint256 dai,
         address urn,
         bytes32 ilk
@@ -578,15 +835,5 @@ library MakerDaiDelegateLib {
         dart = uint256(dart) <= art ? -dart : -int256(art);
     }
 
-    function convertTo18(address gemJoin, uint256 amt)
-        internal
-        returns (uint256 wad)
-    {
-        // For those collaterals that have less than 18 decimals precision we need to do the conversion before
-        // passing to frob function
-        // Adapters will automatically handle the difference of precision
-        wad = amt.mul(10**(18 - GemJoinLike(gemJoin).dec()));
-    }
-
 
 }
@@ -64,9 +64,11 @@ interface VatLike {
 }
 
 interface GemJoinLike {
-    function dec() external returns (uint256);
+    function dec() external view returns (uint256);
 
-    function gem() external returns (GemLike);
+    function gem() external view returns (GemLike);
+
+    function ilk() external view returns (bytes32);
 
     function join(address, uint256) external payable;
 
@@ -75,6 +77,10 @@ interface GemJoinLike {
 
 interface JugLike {
     function drip(bytes32) external returns (uint256);
+
+    function ilks(bytes32) external view returns (uint256 duty, uint256 rho);
+
+    function base() external view returns (uint256);
 }
 
 interface OasisLike {
@@ -0,0 +1,149 @@
+import json
+from pathlib import Path
+
+from brownie import Contract, Wei, accounts, chain, config, project
+from brownie.network.contract import ContractContainer
+from brownie.project import compiler
+
+# Compiles Strategy and MakerDaiDelegateLib for every optimizer run count and
+# build variant below, deploys each build on the fork and reports bytecode size,
+# deployment gas and gas of the hot paths:
+#
+#   brownie run build_report --network mainnet-fork
+#
+# The table is printed and written to reports/build-report.json.
+
+OPTIMIZER_RUNS = [1, 200, 1000, 10000, 100000]
+# Strategy delegatecalls every cdp view into the library, StrategyInlinedViews
+# compiles the hot ones in. See scripts/deploy.py
+VARIANTS = {"library": "Strategy", "inlined": "StrategyInlinedViews"}
+LIBRARY = "MakerDaiDelegateLib"
+EIP170_LIMIT = 24576
+
+REPORT = Path("reports") / "build-report.json"
+
+# GUNIV3DAIUSDC2-A
+ILK = "0x47554e49563344414955534443322d4100000000000000000000000000000000"
+GEM_JOIN = "0xA7e4dDde3cBcEf122851A7C8F7A55f23c0Daf335"
+DAI = "0x6B175474E89094C44Da98b954EedeAC495271d0F"
+DAI_WHALE = "0x47ac0fb4f2d84898e4d9e7b4dab3c24507a6d503"
+DEPOSIT = Wei("50000 ether")
+
+COLUMNS = [
+    ("variant", 10),
+    ("runs", 8),
+    ("strategy B", 12),
+    ("library B", 11),
+    ("deploy gas", 12),
+    ("harvest wind", 14),
+    ("harvest", 10),
+    ("tend", 10),
+    ("tendTrigger", 13),
+    ("harvestTrig", 13),
+    ("totalAssets", 13),
+]
+
+
+def compile_builds(runs):
+    root = project.check_for_project()
+    sources = {
+        path.relative_to(root).as_posix(): path.read_text()
+        for folder in ("contracts", "interfaces")
+        for path in root.joinpath(folder).glob("**/*.sol")
+    }
+    solc = config["compiler"]["solc"]
+    return compiler.compile_and_format(
+        sources,
+        solc_version=solc["version"],
+        optimize=True,
+        runs=runs,
+        remappings=solc["remappings"],
+        allow_paths=root.as_posix(),
+    )
+
+
+def code_size(build):
+    return len(build["deployedBytecode"]) // 2
+
+
+def link(build, library):
+    # brownie pads unlinked library references to 40 characters
+    marker = f"__{LIBRARY:_<38}"
+    return dict(build, bytecode=build["bytecode"].replace(marker, library.address[2:].lower()))
+
+
+def deploy_vault(dev):
+    Vault = project.load(
+        Path.home() / ".brownie" / "packages" / config["dependencies"][0]
+    ).Vault
+    vault = dev.deploy(Vault)
+    vault.initialize(DAI, dev, dev, "", "", dev, dev, {"from": dev})
+    vault.setDepositLimit(2 ** 256 - 1, {"from": dev})
+    return vault
+
+
+def measure(builds, strategy_name, vault, dev):
+    proj = project.get_loaded_projects()[0]
+    library = ContractContainer(proj, builds[LIBRARY]).deploy({"from": dev})
+    strategy = ContractContainer(proj, link(builds[strategy_name], library)).deploy(
+        vault, "Strategy-Maker-lev-GUNIV3DAIUSDC", ILK, GEM_JOIN, {"from": dev}
+    )
+    result = {"deploy gas": library.tx.gas_used + strategy.tx.gas_used}
+
+    vault.addStrategy(strategy, 10_000, 0, 2 ** 256 - 1, 1_000, {"from": dev})
+    dai = Contract(DAI)
+    dai.transfer(dev, DEPOSIT, {"from": accounts.at(DAI_WHALE, force=True)})
+    dai.approve(vault, DEPOSIT, {"from": dev})
+    vault.deposit(DEPOSIT, {"from": dev})
+    chain.sleep(1)
+    result["harvest wind"] = strategy.harvest({"from": dev}).gas_used
+
+    # Idle polls: in band, nothing to wind, just reported
+    result["tendTrigger"] = strategy.tendTrigger.estimate_gas(0)
+    result["harvestTrig"] = strategy.harvestTrigger.estimate_gas(0)
+    result["totalAssets"] = strategy.estimatedTotalAssets.estimate_gas()
+
+    chain.sleep(3600)
+    result["harvest"] = strategy.harvest({"from": dev}).gas_used
+
+    # Raise the target above the band so the tend has to unwind
+    strategy.setCollateralizationRatio(
+        strategy.collateralizationRatio() + 2 * strategy.lowerRebalanceTolerance(),
+        {"from": dev},
+    )
+    result["tend"] = strategy.tend({"from": dev}).gas_used
+    return result
+
+
+def main():
+    dev = accounts[0]
+    vault = deploy_vault(dev)
+    rows = []
+    for runs in OPTIMIZER_RUNS:
+        print(f"Compiling with runs={runs}")
+        builds = compile_builds(runs)
+        for variant, strategy_name in VARIANTS.items():
+            row = {
+                "variant": variant,
+                "runs": runs,
+                "strategy B": code_size(builds[strategy_name]),
+                "library B": code_size(builds[LIBRARY]),
+            }
+            if max(row["strategy B"], row["library B"]) > EIP170_LIMIT:
+                # Can not be deployed on mainnet, skip the gas numbers
+                rows.append(row)
+                continue
+            chain.snapshot()
+            row.update(measure(builds, strategy_name, vault, dev))
+            chain.revert()
+            rows.append(row)
+
+    print("".join(f"{name:>{width}}" for name, width in COLUMNS))
+    for row in rows:
+        print("".join(f"{str(row.get(name, '-')):>{width}}" for name, width in COLUMNS))
+    print(f"Sizes above {EIP170_LIMIT} bytes (EIP-170) are not deployed")
+
+    REPORT.parent.mkdir(parents=True, exist_ok=True)
+    with REPORT.open("w") as fp:
+        json.dump(rows, fp, indent=2)
+    print(f"Report written to {REPORT}")
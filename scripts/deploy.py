@@ -1,10 +1,25 @@
 from pathlib import Path
 
-from brownie import Strategy, MakerDaiDelegateLib, accounts, config, network, project, web3
+from brownie import Strategy, StrategyInlinedViews, MakerDaiDelegateLib, accounts, config, network, project, web3
 from eth_utils import is_checksum_address
 import click
 
 API_VERSION = config["dependencies"][0].split("@")[-1]
+
+# G-UNI pool -> (ilk, gemJoin) of the Maker collateral type
+POOLS = {
+    "GUNIV3DAIUSDC1": (
+        "0x47554e49563344414955534443312d4100000000000000000000000000000000",
+        "0xbFD445A97e7459b0eBb34cfbd3245750Dba4d7a4",
+    ),
+    "GUNIV3DAIUSDC2": (
+        "0x47554e49563344414955534443322d4100000000000000000000000000000000",
+        "0xA7e4dDde3cBcEf122851A7C8F7A55f23c0Daf335",
+    ),
+}
+# Strategy delegatecalls every cdp view into the library, StrategyInlinedViews
+# compiles the hot ones in. See tests/detailedtests/test_inlined_views.py
+VARIANTS = {"library": Strategy, "inlined": StrategyInlinedViews}
 Vault = project.load(
     Path.home() / ".brownie" / "packages" / config["dependencies"][0]
 ).Vault
@@ -52,9 +67,12 @@ def main():
     symbol: '{vault.symbol()}'
     """
     )
+    pool = click.prompt("G-UNI pool", type=click.Choice(list(POOLS)), default="GUNIV3DAIUSDC2")
+    ilk, gemJoin = POOLS[pool]
+    variant = click.prompt("Build variant", type=click.Choice(list(VARIANTS)), default="library")
     publish_source = click.confirm("Verify source on etherscan?")
     if input("Deploy Strategy? y/[N]: ").lower() != "y":
         return
 
     lib = MakerDaiDelegateLib.deploy({"from": dev})
-    strategy = Strategy.deploy(vault,  "Strategy-Maker-lev-GUNIV3DAIUSDC-0.01%", {"from": dev}, publish_source=publish_source)
+    strategy = VARIANTS[variant].deploy(vault, f"Strategy-Maker-lev-{pool}", ilk, gemJoin, {"from": dev}, publish_source=publish_source)
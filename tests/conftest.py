@@ -1,36 +1,42 @@
 import pytest
-from brownie import config, convert, interface, Contract
+from brownie import chain, config, convert, interface, Contract
+from helpers.funding import fund, fund_yieldBearing
+from helpers.maker import MakerStandIn
+
+# `brownie test --timing` reports time, RPC calls and gas per fixture and test
+pytest_plugins = ["helpers.profiler"]
 ##################
 #################
 #Decide on Strategy Contract
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def StrategyChoice(Strategy):    
     choice = Strategy #Strategy = maker-eth-dai-delegator, NewStrategy = maker-wsteth-dai-lev 
     yield choice
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def TestStrategyChoice(TestStrategy):    
     choice = TestStrategy #TestStrategy, NewTestStrategy
     yield choice
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def MakerDaiDelegateClonerChoice(MakerDaiDelegateCloner):    
     choice = MakerDaiDelegateCloner 
     yield choice
 #######################################################
 #Decide on wantToken = token
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def wantNr():    
     wantNr = 0 #Currently: 
     #0 = DAI,   1 = USDC 
     yield wantNr
 #######################################################
-#Decide on yieldBearing = collateral Token on Money Market
-@pytest.fixture(autouse=True)
-def yieldBearingNr():    
-    yieldBearingNr = 0 #Currently: GUNIV3DAIUSDC1 0.05%
-    #0 = GUNIV3DAIUSDC1 0.0%,   1 =  
+#yieldBearing = collateral Token on Money Market, every test runs once per pool
+#Deployments that only depend on the pool are session-scoped and shared by all tests of that pool
+@pytest.fixture(scope="session", autouse=True, params=[0, 1], ids=["GUNIV3DAIUSDC1", "GUNIV3DAIUSDC2"])
+def yieldBearingNr(request):    
+    yieldBearingNr = request.param
+    #0 = GUNIV3DAIUSDC1 0.05%,   1 = GUNIV3DAIUSDC2 0.01%
     yield yieldBearingNr
 #######################################################
-@pytest.fixture
+@pytest.fixture(scope="session")
 def token(dai, usdc, wantNr):   
     #signifies want token given by wantNr
     token_address = [
@@ -39,7 +45,7 @@ def token(dai, usdc, wantNr):
     ]
     yield token_address[wantNr]
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def partnerToken(dai, usdc, wantNr):   
     #signifies want token given by wantNr
     token_address = [
@@ -48,7 +54,7 @@ def partnerToken(dai, usdc, wantNr):
     ]
     yield token_address[wantNr]
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def yieldBearing(guniv3daiusdc1, guniv3daiusdc2, yieldBearingNr):   
     #signifies want token given by wantNr
     yieldBearing_address = [
@@ -88,22 +94,22 @@ def weth_amout(user, weth):
     user.transfer(weth, weth_amout)
     yield weth_amout
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def guniv3daiusdc1():
     token_address = "0xAbDDAfB225e10B90D798bB8A886238Fb835e2053" #stETH
     yield Contract(token_address)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def guniv3daiusdc2():
     token_address = "0x50379f632ca68D36E50cfBC8F78fe16bd1499d1e"  # wstETH
     yield Contract(token_address)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dai():
     dai_address = "0x6B175474E89094C44Da98b954EedeAC495271d0F"
     yield Contract(dai_address)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def usdc():
     token_address = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
     yield Contract(token_address)
@@ -116,7 +122,7 @@ def usdc():
 #def wsteth_whale(accounts):
 #    yield accounts.at("0x62e41b1185023bcc14a465d350e1dde341557925") 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def token_whale(accounts, wantNr, dai_whale):
     #eth_whale = accounts.at("0xda9dfa130df4de4673b89022ee50ff26f6ea73cf", force=True)
     #token_whale_address = [
@@ -146,9 +152,7 @@ def token_whale_BIG(accounts, wantNr, dai_whale):
 
 @pytest.fixture
 def yieldBearing_whale(accounts, yieldBearingNr, token_whale, yieldBearing, token, partnerToken, strategy):
-    token.approve(yieldBearing, 100000000000000000000e18, {"from": token_whale})
-    partnerToken.approve(yieldBearing, 10000000000000000000000e6, {"from": token_whale})
-    yieldBearing.mint(yieldBearing.getMintAmounts(token.balanceOf(token_whale)*0.1, partnerToken.balanceOf(token_whale)*0.1)[2], token_whale, {"from": token_whale})
+    fund_yieldBearing(yieldBearing, token, partnerToken, token_whale, 10_000_000 * 10 ** token.decimals(), token_whale)
     yield token_whale
 
 @pytest.fixture
@@ -161,7 +165,7 @@ def weth_amount(user, weth):
 def weth_whale(accounts):
     yield accounts.at("0x57757e3d981446d585af0d9ae4d7df6d64647806", force=True)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dai_whale(accounts):
     yield accounts.at("0x47ac0fb4f2d84898e4d9e7b4dab3c24507a6d503", force=True)
 
@@ -171,14 +175,19 @@ def yvDAI():
     yield Contract(vault_address)
 
 @pytest.fixture(autouse=True)
-def isolation(fn_isolation):
-    pass
-
-@pytest.fixture(autouse=True)
+def isolation():
+    # Unlike fn_isolation this does not reset the chain between modules, so the
+    # session-scoped deployments of each pool stay usable by every module
+    chain.snapshot()
+    yield
+    chain.revert()
+
+@pytest.fixture(scope="session", autouse=True)
 def lib(gov, MakerDaiDelegateLib):
+    # Shared by the strategies of both pools
     yield MakerDaiDelegateLib.deploy({"from": gov})
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gov(accounts):
     yield accounts.at("0xFEB4acf3df3cDEA7399794D0869ef76A6EfAff52", force=True)
 
@@ -190,19 +199,19 @@ def user(accounts):
 def user2(accounts):
     yield accounts[4]
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def rewards(accounts):
     yield accounts[1]
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def guardian(accounts):
     yield accounts[2]
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def management(accounts):
     yield accounts[3]
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def strategist(accounts):
     yield accounts.at("0x16388463d60FFE0661Cf7F1f31a7D658aC790ff7", force=True)
 
@@ -227,46 +236,38 @@ def unirouter():
 @pytest.fixture
 def amount(accounts, token, user, token_whale):
     amount = 50000 * 10 ** token.decimals()
-    # In order to get some funds for the token you are about to use,
-    # it impersonate an exchange address to use it's funds.
-    reserve = token_whale
-    #reserve = accounts.at("0xF977814e90dA44bFA03b6295A0616a897441aceC", force=True)
-    token.transfer(user, amount, {"from": reserve})
+    # Write the balance into the token storage, the whale is only a fallback
+    # for nodes that cannot set storage
+    fund(token, user, amount, token_whale)
     yield amount
 
 @pytest.fixture
 def amount2(accounts, token, user2, token_whale):
     amount = 100000 * 10 ** token.decimals()
-    # In order to get some funds for the token you are about to use,
-    # it impersonate an exchange address to use it's funds.
-    #reserve = accounts.at("0xF977814e90dA44bFA03b6295A0616a897441aceC", force=True)
-    reserve = token_whale
-    token.transfer(user2, amount, {"from": reserve})
+    # Write the balance into the token storage, the whale is only a fallback
+    # for nodes that cannot set storage
+    fund(token, user2, amount, token_whale)
     yield amount
 
 @pytest.fixture
 def amountBIGTIME(accounts, token, user, token_whale):
     #amount = 20000 * 10 ** token.decimals()
     amount = 200000 * 10 ** token.decimals()
-    # In order to get some funds for the token you are about to use,
-    # it impersonate an exchange address to use it's funds.
-    #reserve = accounts.at("0xF977814e90dA44bFA03b6295A0616a897441aceC", force=True)
-    reserve = token_whale
-    token.transfer(user, amount, {"from": reserve})
+    # Write the balance into the token storage, the whale is only a fallback
+    # for nodes that cannot set storage
+    fund(token, user, amount, token_whale)
     yield amount
 
 @pytest.fixture
 def amountBIGTIME2(accounts, token, user2, token_whale):
     #amount = 6000 * 10 ** token.decimals()
     amount = 1000000 * 10 ** token.decimals()
-    # In order to get some funds for the token you are about to use,
-    # it impersonate an exchange address to use it's funds.
-    #reserve = accounts.at("0xF977814e90dA44bFA03b6295A0616a897441aceC", force=True)
-    reserve = token_whale
-    token.transfer(user2, amount, {"from": reserve})
+    # Write the balance into the token storage, the whale is only a fallback
+    # for nodes that cannot set storage
+    fund(token, user2, amount, token_whale)
     yield amount
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def vault(pm, gov, rewards, guardian, management, token):
     Vault = pm(config["dependencies"][0]).Vault
     vault = guardian.deploy(Vault)
@@ -286,14 +287,14 @@ def productionVault(wantNr):
     yield Contract(vault_address[wantNr])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def osmProxy_want():
     # Allow the strategy to query the OSM proxy
     osm = Contract("0xCF63089A8aD2a9D8BD6Bb8022f3190EB7e1eD0f1")   # Points to ETH/USD
     # osm = interface.IOSMedianizer("0xCF63089A8aD2a9D8BD6Bb8022f3190EB7e1eD0f1")
     yield osm
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def osmProxy_yieldBearing():
     # Allow the strategy to query the OSM proxy
     osm = Contract("0xCF63089A8aD2a9D8BD6Bb8022f3190EB7e1eD0f1")
@@ -306,7 +307,7 @@ def osmProxy_yieldBearing():
 #    yield gemJoin
     
 #This is the collateral adapter, so yieldbearing token, not want token if want != yieldBearing
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gemJoinAdapter(yieldBearingNr):
     gemJoin = [
     "0xbFD445A97e7459b0eBb34cfbd3245750Dba4d7a4",   #0 = GUNIV3DAIUSDC1 0.05%
@@ -314,7 +315,7 @@ def gemJoinAdapter(yieldBearingNr):
     ]
     yield Contract(gemJoin[yieldBearingNr])
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def healthCheck(gov):
     healthCheck = Contract("0xDDCea799fF1699e98EDF118e0629A974Df7DF012")
     healthCheck.setProfitLimitRatio(1000, {"from": gov})  #default 100, # 1%
@@ -354,8 +355,8 @@ def strategy(vault, StrategyChoice, gov, osmProxy_want, osmProxy_yieldBearing, c
     #osmProxy_yieldBearing.setAuthorized(strategy, {"from": gov})
     yield strategy
 
-@pytest.fixture
-def test_strategy(
+@pytest.fixture(scope="session")
+def test_strategy_deployment(
     TestStrategyChoice,
     strategist,
     vault,
@@ -367,17 +368,23 @@ def test_strategy(
     #price_oracle_want_to_eth,
     gov, ilk_yieldBearing, ilk_want, healthCheck
 ):
+    # Deployed once per pool, each test registers it on the vault again
     strategy = strategist.deploy(
         TestStrategyChoice,
         vault,
         "Strategy-Maker-lev-GUNIV3DAIUSDC",
         #ilk_want,
-        #ilk_yieldBearing,
-        #gemJoinAdapter,
+        ilk_yieldBearing,
+        gemJoinAdapter,
       #  osmProxy_want,
       #  osmProxy_yieldBearing,
       #  price_oracle_want_to_eth
     )
+    yield strategy
+
+@pytest.fixture
+def test_strategy(test_strategy_deployment, vault, gov):
+    strategy = test_strategy_deployment
     #strategy.setRetainDebtFloorBool(False, {"from": gov})
     strategy.setDoHealthCheck(True, {"from": gov})
 
@@ -402,7 +409,7 @@ def test_strategy(
 #    ilk = "0x5753544554482d41000000000000000000000000000000000000000000000000"  # wstETH
 #    yield ilk
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ilk_want(wantNr):
     ilk_hashes = [
     "0x4554482d43000000000000000000000000000000000000000000000000000000",   #0 = WETH
@@ -413,7 +420,7 @@ def ilk_want(wantNr):
     yield ilk_hashes[wantNr]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ilk_yieldBearing(yieldBearingNr):
     ilk_hashes = [
     "0x47554e49563344414955534443312d4100000000000000000000000000000000",   #0 = GUNIV3DAIUSDC1 0.05%
@@ -421,6 +428,12 @@ def ilk_yieldBearing(yieldBearingNr):
     ]
     yield ilk_hashes[yieldBearingNr]
 
+@pytest.fixture(scope="session")
+def maker(ilk_yieldBearing):
+    # Governance control over the forked Maker contracts of the pool's ilk:
+    # dust, debt ceiling, collateral price and stability fee knobs
+    yield MakerStandIn(ilk_yieldBearing)
+
 @pytest.fixture(scope="session")
 def RELATIVE_APPROX():
     yield 1e-4
@@ -443,7 +456,7 @@ def RELATIVE_APPROX_ROUGH():
 # >>> ilk
 # '5946492d41000000000000000000000000000000000000000000000000000000'
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cloner(
     strategist,
     vault,
@@ -461,8 +474,8 @@ def cloner(
         vault,
         "Strategy-Maker-lev-GUNIV3DAIUSDC",
         #ilk_want,
-        #ilk_yieldBearing,
-        #gemJoinAdapter,
+        ilk_yieldBearing,
+        gemJoinAdapter,
      #   osmProxy_want,
      #   osmProxy_yieldBearing,
      #   price_oracle_want_to_eth,
@@ -45,6 +45,36 @@ def test_set_rebalance_tolerance_acl(
 
 
 
+def test_risk_parameters_are_bounded_by_packed_storage(strategy, gov):
+    strategy.setMinMaxSingleTrade(2 ** 128 - 1, 2 ** 120 - 1, {"from": gov})
+    assert strategy.minSingleTrade() == 2 ** 128 - 1
+    assert strategy.maxSingleTrade() == 2 ** 120 - 1
+
+    with reverts():
+        strategy.setMinMaxSingleTrade(2 ** 128, 1, {"from": gov})
+
+    with reverts():
+        strategy.setMinMaxSingleTrade(1, 2 ** 120, {"from": gov})
+
+    with reverts():
+        strategy.setCreditThreshold(2 ** 128, {"from": gov})
+
+    # Tolerances are not capped below what the liquidation ratio allows
+    strategy.setCollateralizationRatio(1.2e18, {"from": gov})
+    strategy.setRebalanceTolerance(0.1e18, 2 ** 92 - 1, {"from": gov})
+    assert strategy.lowerRebalanceTolerance() == 0.1e18
+    assert strategy.upperRebalanceTolerance() == 2 ** 92 - 1
+
+    with reverts():
+        strategy.setRebalanceTolerance(5, 2 ** 92, {"from": gov})
+
+    with reverts():
+        strategy.setTendProfitability(2 ** 64, 1, {"from": gov})
+
+    with reverts():
+        strategy.setTendProfitability(1, 2 ** 32, {"from": gov})
+
+
 def DISABLED_switch_dex_acl(strategy, gov, strategist, management, guardian, user):
     uniswap = "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D"
     sushiswap = "0xd9e1cE17f2641f24aE83637ab66a2cca9C378B9F"
@@ -89,6 +119,41 @@ def test_shift_cdp_acl(strategy, gov, strategist, management, guardian, user):
         strategy.shiftToCdp(123, {"from": user})
 
 
+def test_set_tend_profitability_acl(strategy, gov, strategist, management, guardian, user):
+    strategy.setTendProfitability(0.1e18, 7 * 24 * 3600, {"from": gov})
+    assert strategy.yieldBearingApr() == 0.1e18
+    assert strategy.tendHorizon() == 7 * 24 * 3600
+
+    strategy.setTendProfitability(0.2e18, 14 * 24 * 3600, {"from": management})
+    assert strategy.yieldBearingApr() == 0.2e18
+    assert strategy.tendHorizon() == 14 * 24 * 3600
+
+    with reverts("!authorized"):
+        strategy.setTendProfitability(0, 0, {"from": strategist})
+
+    with reverts("!authorized"):
+        strategy.setTendProfitability(0, 0, {"from": guardian})
+
+    with reverts("!authorized"):
+        strategy.setTendProfitability(0, 0, {"from": user})
+
+
+def test_reapprove_spenders_acl(strategy, gov, strategist, management, guardian, user):
+    strategy.reapproveSpenders({"from": gov})
+
+    with reverts("!authorized"):
+        strategy.reapproveSpenders({"from": strategist})
+
+    with reverts("!authorized"):
+        strategy.reapproveSpenders({"from": management})
+
+    with reverts("!authorized"):
+        strategy.reapproveSpenders({"from": guardian})
+
+    with reverts("!authorized"):
+        strategy.reapproveSpenders({"from": user})
+
+
 def test_allow_managing_cdp_acl(strategy, gov, strategist, management, guardian, user):
     cdpManager = Contract("0x5ef30b9986345249bc32d8928B7ee64DE9435E39")
     cdp = strategy.cdpId()
@@ -134,6 +199,28 @@ def test_emergency_debt_repayment_acl(
         strategy.emergencyDebtRepayment(strategy.estimatedTotalAssets(), {"from": user})
 
 
+def test_emergency_deleverage_acl(
+    strategy, gov, strategist, management, guardian, user
+):
+    strategy.emergencyDeleverage(1e18, {"from": gov})
+    strategy.emergencyDeleverage(1e18, {"from": management})
+
+    with reverts("!authorized"):
+        strategy.emergencyDeleverage(1e18, {"from": strategist})
+
+    with reverts("!authorized"):
+        strategy.emergencyDeleverage(1e18, {"from": guardian})
+
+    with reverts("!authorized"):
+        strategy.emergencyDeleverage(1e18, {"from": user})
+
+    with reverts():
+        strategy.emergencyDeleverage(0, {"from": gov})
+
+    with reverts():
+        strategy.emergencyDeleverage(1e18 + 1, {"from": gov})
+
+
 def DISABLED_repay_debt_acl(
     vault,
     strategy,
@@ -0,0 +1,47 @@
+from brownie import Strategy, reverts
+
+
+def test_batch_clone_lands_on_predicted_addresses(
+    cloner, vault, strategist, rewards, keeper, gov, ilk_yieldBearing, gemJoinAdapter
+):
+    salt = "0x" + "01" * 32
+    params = [
+        (vault, f"Strategy-Maker-lev-GUNIV3DAIUSDC-{i}", ilk_yieldBearing, gemJoinAdapter)
+        for i in range(3)
+    ]
+    predicted = [cloner.predictCloneAddress(gov, salt, i) for i in range(3)]
+
+    tx = cloner.cloneMakerDaiDelegateBatch(params, strategist, rewards, keeper, salt, {"from": gov})
+
+    clones = tx.return_value
+    assert list(clones) == predicted
+    assert [event["clone"] for event in tx.events["Cloned"]] == predicted
+    cdp_ids = set()
+    for i, clone in enumerate(clones):
+        strategy = Strategy.at(clone)
+        assert strategy.vault() == vault
+        assert strategy.name() == f"Strategy-Maker-lev-GUNIV3DAIUSDC-{i}"
+        assert strategy.strategist() == strategist
+        assert strategy.rewards() == rewards
+        assert strategy.keeper() == keeper
+        cdp_ids.add(strategy.cdpId())
+    # Every clone opens its own cdp
+    assert len(cdp_ids) == 3
+
+    # Another deployer gets different addresses for the same salt
+    assert cloner.predictCloneAddress(strategist, salt, 0) not in predicted
+
+
+def test_clone_rejects_gem_join_of_another_ilk(
+    cloner, vault, strategist, gov, ilk_yieldBearing, yieldBearingNr
+):
+    # gemJoin of the other G-UNI pool
+    other_gem_join = [
+        "0xA7e4dDde3cBcEf122851A7C8F7A55f23c0Daf335",
+        "0xbFD445A97e7459b0eBb34cfbd3245750Dba4d7a4",
+    ][yieldBearingNr]
+
+    with reverts():
+        cloner.cloneMakerDaiDelegate(
+            vault, strategist, strategist, strategist, "name", ilk_yieldBearing, other_gem_join, {"from": gov}
+        )
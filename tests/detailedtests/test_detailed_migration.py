@@ -34,8 +34,8 @@ def test_detailed_migration(
             strategist,
             "name",
             #ilk_want,
-            #ilk_yieldBearing,
-            #gemJoinAdapter,
+            ilk_yieldBearing,
+            gemJoinAdapter,
             #strategy.wantToUSDOSMProxy(),
             #strategy.yieldBearingToUSDOSMProxy(),
             #strategy.chainlinkWantToETHPriceFeed(),
@@ -51,6 +51,8 @@ def test_detailed_migration(
     assert new_strategy.balanceOfDebt() > amount
     assert (pytest.approx(new_strategy.estimatedTotalAssets(), rel=RELATIVE_APPROX_LOSSY) == amount )
     assert new_strategy.cdpId() == orig_cdp_id
+    # urn is cached on shift and must follow the cdp
+    assert new_strategy.urn() == strategy.urn()
     assert vault.strategies(new_strategy).dict()["totalDebt"] == amount
 
     #Old strategy should have relinquished ownership of the CDP
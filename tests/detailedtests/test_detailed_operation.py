@@ -236,3 +236,32 @@ def test_triggers(chain, gov, vault, strategy, token, amount, user):
 
     strategy.harvestTrigger(0)
     strategy.tendTrigger(0)
+
+
+def test_strategy_state_matches_individual_views(chain, gov, vault, strategy, token, amount, user):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+    state = strategy.getStrategyState().dict()
+    assert state["cdpId"] == strategy.cdpId()
+    assert state["urn"] == strategy.urn()
+    assert state["wantPerYieldBearing"] == strategy.getWantPerYieldBearing()
+    assert state["balanceOfWant"] == strategy.balanceOfWant()
+    assert state["balanceOfYieldBearing"] == strategy.balanceOfYieldBearing()
+    assert state["balanceOfMakerVault"] == strategy.balanceOfMakerVault()
+    assert state["balanceOfDebt"] == strategy.balanceOfDebt()
+    assert state["currentMakerVaultRatio"] == strategy.getCurrentMakerVaultRatio()
+    assert state["estimatedTotalAssets"] == strategy.estimatedTotalAssets()
+    assert state["balanceOfDaiAvailableToMint"] == strategy.balanceOfDaiAvailableToMint()
+    assert state["collateralizationRatio"] == strategy.collateralizationRatio()
+    assert state["lowerRebalanceTolerance"] == strategy.lowerRebalanceTolerance()
+    assert state["upperRebalanceTolerance"] == strategy.upperRebalanceTolerance()
+    assert state["minSingleTrade"] == strategy.minSingleTrade()
+    assert state["maxSingleTrade"] == strategy.maxSingleTrade()
+    assert state["creditThreshold"] == strategy.creditThreshold()
+    assert state["yieldBearingApr"] == strategy.yieldBearingApr()
+    assert state["tendHorizon"] == strategy.tendHorizon()
+    assert state["tendTrigger"] == strategy.tendTrigger(0)
+    assert state["harvestTrigger"] == strategy.harvestTrigger(0)
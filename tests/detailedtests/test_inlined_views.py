@@ -0,0 +1,54 @@
+import pytest
+
+from brownie import Strategy, StrategyInlinedViews
+
+
+# Size/gas comparison between the library-delegating Strategy and the build
+# variant that inlines the hot cdp views. Run with -s to see the numbers.
+def test_inlined_views_match_and_save_gas(
+    chain,
+    token,
+    vault,
+    strategy,
+    strategist,
+    amount,
+    gov,
+    user,
+    ilk_yieldBearing,
+    gemJoinAdapter,
+    RELATIVE_APPROX_LOSSY,
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+    views = ["balanceOfDebt", "balanceOfMakerVault", "getCurrentMakerVaultRatio", "estimatedTotalAssets"]
+    before = {view: getattr(strategy, view)() for view in views}
+    tend_trigger_gas = strategy.tendTrigger.estimate_gas(0)
+
+    inlined = strategist.deploy(
+        StrategyInlinedViews,
+        vault,
+        "Strategy-Maker-lev-GUNIV3DAIUSDC",
+        ilk_yieldBearing,
+        gemJoinAdapter,
+    )
+    vault.migrateStrategy(strategy, inlined, {"from": gov})
+    inlined.shiftToCdp(strategy.cdpId(), {"from": gov})
+
+    # Same cdp, same answers
+    for view in views:
+        assert getattr(inlined, view)() == before[view]
+    inlined_tend_trigger_gas = inlined.tendTrigger.estimate_gas(0)
+
+    size = len(Strategy.bytecode) // 2
+    inlined_size = len(StrategyInlinedViews.bytecode) // 2
+    print(f"\nbytecode: {size} -> {inlined_size} bytes")
+    print(f"tendTrigger gas: {tend_trigger_gas} -> {inlined_tend_trigger_gas}")
+    assert inlined_size <= 24576  # EIP-170
+    assert inlined_tend_trigger_gas < tend_trigger_gas
+
+    tx = inlined.harvest({"from": gov})
+    print(f"harvest gas: {tx.gas_used}")
+    assert pytest.approx(inlined.estimatedTotalAssets(), rel=RELATIVE_APPROX_LOSSY) == amount
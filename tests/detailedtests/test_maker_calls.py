@@ -0,0 +1,72 @@
+from brownie import Contract
+
+VAT = "0x35D1b3F3D7966A1DFe207aa4514C12a259A0492B"
+JUG = "0x19c0976f590D67707E62397C87829d896Dc0f1F1"
+DAI_JOIN = "0x9759A6Ac90977b93B58547b4A71c78317f391A28"
+FLASH = "0x1EB4CF3A948E7D72A198fe073cCb8C7a948cD853"
+PSM = "0x89B78CfA322F6C5dE0aBcEecab66Aee45393cC5A"
+MAX_UINT256 = 2 ** 256 - 1
+
+
+def calls_to(tx, address, function):
+    return [
+        c for c in tx.subcalls
+        if c["to"] == address and c.get("function", "").startswith(function)
+    ]
+
+
+def test_vat_permission_is_granted_once_at_cdp_open(strategy):
+    vat = Contract(VAT)
+    assert vat.can(strategy, DAI_JOIN) == 1
+
+
+def test_spenders_are_approved_once_at_initialization(
+    strategy, dai, usdc, yieldBearing, gemJoinAdapter
+):
+    psm_gem_join = Contract(PSM).gemJoin()
+    for token, spender in [
+        (dai, FLASH),
+        (dai, DAI_JOIN),
+        (dai, PSM),
+        (usdc, psm_gem_join),
+        (dai, yieldBearing),
+        (usdc, yieldBearing),
+        (yieldBearing, gemJoinAdapter),
+    ]:
+        assert token.allowance(strategy, spender) == MAX_UINT256
+
+
+def test_harvest_drips_once_and_skips_one_time_permissions(
+    chain, token, dai, vault, strategy, amount, user, gov
+):
+    # Load the ABIs so the subcalls get decoded
+    Contract(VAT)
+    Contract(JUG)
+
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    tx = strategy.harvest({"from": gov})
+
+    assert strategy.balanceOfDebt() > 0
+    assert len(calls_to(tx, JUG, "drip")) == 1
+    assert len(calls_to(tx, VAT, "hope")) == 0
+    assert len(calls_to(tx, dai.address, "allowance")) == 0
+
+
+def test_harvest_reads_gUNI_price_once(
+    chain, token, vault, strategy, yieldBearing, amount, user, gov
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    chain.sleep(1)
+
+    # prepareReturn reads the price and adjustPosition reuses it
+    tx = strategy.harvest({"from": gov})
+    assert len(calls_to(tx, yieldBearing.address, "getUnderlyingBalances")) == 1
+
+    # A tend has no prepareReturn and reads its own
+    tx = strategy.tend({"from": gov})
+    assert len(calls_to(tx, yieldBearing.address, "getUnderlyingBalances")) == 1
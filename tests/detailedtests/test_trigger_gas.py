@@ -0,0 +1,38 @@
+BASE_FEE_ORACLE = "0xb5e1CAcB567d98faaDB60a1fD4820720141f064F"
+
+# Keeper networks simulate both triggers every block. A poll that ends in
+# False must stay within these budgets, intrinsic 21k included.
+# Run with -s to see the numbers.
+TEND_TRIGGER_GAS_BUDGET = 150_000
+HARVEST_TRIGGER_GAS_BUDGET = 100_000
+
+
+def base_fee_reads(tx):
+    return [c for c in tx.subcalls if c["to"].lower() == BASE_FEE_ORACLE.lower()]
+
+
+def test_idle_trigger_polls_stay_within_budget(
+    chain, token, vault, strategy, amount, user, gov
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+    # In band, nothing left to wind and the harvest just reported
+    assert strategy.tendTrigger(0) == False
+    assert strategy.harvestTrigger(0) == False
+
+    tend_gas = strategy.tendTrigger.estimate_gas(0)
+    harvest_gas = strategy.harvestTrigger.estimate_gas(0)
+    print(f"\ntendTrigger gas: {tend_gas}, harvestTrigger gas: {harvest_gas}")
+    assert tend_gas < TEND_TRIGGER_GAS_BUDGET
+    assert harvest_gas < HARVEST_TRIGGER_GAS_BUDGET
+
+    # The base fee oracle is only read once there is something to do
+    assert len(base_fee_reads(strategy.tendTrigger.transact(0, {"from": gov}))) == 0
+    assert len(base_fee_reads(strategy.harvestTrigger.transact(0, {"from": gov}))) == 0
+
+    strategy.setForceHarvestTriggerOnce(True, {"from": gov})
+    tx = strategy.harvestTrigger.transact(0, {"from": gov})
+    assert len(base_fee_reads(tx)) == 1
@@ -0,0 +1,35 @@
+import pytest
+
+from brownie import chain, Contract
+
+PSM = "0x89B78CfA322F6C5dE0aBcEecab66Aee45393cC5A"
+
+
+# Gas and PSM fee per unwind size. A partial unwind frees collateral worth
+# exactly flashmint + request, so all the USDC of the burn has to go through
+# the PSM to raise it. Run with -s to see the numbers.
+@pytest.mark.parametrize("withdraw_bps", [100, 1_000, 3_000])
+def test_unwind_psm_cost_benchmark(
+    vault, strategy, token, partnerToken, user, amount, gov, withdraw_bps, RELATIVE_APPROX_LOSSY
+):
+    tin = Contract(PSM).tin()
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    shares = vault.balanceOf(user) * withdraw_bps // 10_000
+    expected = vault.pricePerShare() * shares // 10 ** vault.decimals()
+
+    balance_before = token.balanceOf(user)
+    tx = vault.withdraw(shares, user, 100, {"from": user})
+    psm_volume = sum(event["psmVolume"] for event in tx.events["Unwind"])
+    withdrawn = token.balanceOf(user) - balance_before
+    print(
+        f"\n{withdraw_bps / 100}% withdrawal: gas {tx.gas_used} psm volume {psm_volume} "
+        f"psm fee {psm_volume * tin // 10 ** 18} withdrawn {withdrawn}"
+    )
+
+    # No USDC is left on the strategy after an unwind
+    assert partnerToken.balanceOf(strategy) == 0
+    assert psm_volume > 0
+    assert pytest.approx(withdrawn, rel=RELATIVE_APPROX_LOSSY) == expected
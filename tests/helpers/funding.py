@@ -0,0 +1,140 @@
+from brownie import web3
+from eth_utils import keccak
+
+# Fund test accounts by writing ERC20 balances straight into token storage
+# instead of impersonating whales. Balance slots are discovered by probing
+# once and cached for the rest of the session.
+
+# RPC methods able to overwrite a storage slot, in the order they are tried
+SET_STORAGE_METHODS = [
+    "evm_setAccountStorageAt",  # ganache >= 7
+    "hardhat_setStorageAt",
+    "anvil_setStorageAt",
+]
+# How many slots to probe when looking for the balanceOf mapping
+MAX_PROBED_SLOT = 50
+# Mapping layouts: solidity hashes (key . slot), vyper hashes (slot . key)
+SOLIDITY, VYPER = "solidity", "vyper"
+PROBE_ACCOUNT = "0x000000000000000000000000000000000000dEaD"
+PROBE_VALUE = 0x5EED
+
+_balance_slots = {}
+_set_storage_method = []
+
+
+class FundingUnavailable(RuntimeError):
+    # The node can not fund the account the requested way
+    pass
+
+
+def _word(value):
+    return int(value).to_bytes(32, "big")
+
+
+def _mapping_position(account, slot, layout):
+    key = _word(int(str(account), 16))
+    if layout == SOLIDITY:
+        return int.from_bytes(keccak(key + _word(slot)), "big")
+    return int.from_bytes(keccak(_word(slot) + key), "big")
+
+
+def _rpc(method, params):
+    response = web3.provider.make_request(method, params)
+    if "error" in response:
+        raise ValueError(response["error"])
+    return response["result"]
+
+
+def _storage_params(method, address, position, value):
+    if method == "evm_setAccountStorageAt":
+        return [str(address), "0x" + _word(position).hex(), "0x" + _word(value).hex()]
+    return [str(address), hex(position), "0x" + _word(value).hex()]
+
+
+def _get_storage(address, position):
+    return int.from_bytes(web3.eth.get_storage_at(str(address), position), "big")
+
+
+def _set_storage(address, position, value):
+    if not _set_storage_method:
+        for method in SET_STORAGE_METHODS:
+            try:
+                _rpc(method, _storage_params(method, address, position, value))
+            except ValueError:
+                continue
+            _set_storage_method.append(method)
+            return
+        raise FundingUnavailable("node does not support writing storage slots")
+    method = _set_storage_method[0]
+    _rpc(method, _storage_params(method, address, position, value))
+
+
+def storage_writes_supported():
+    if _set_storage_method:
+        return True
+    try:
+        # Rewrite a slot with its own value to detect support without side effects
+        _set_storage(PROBE_ACCOUNT, 0, _get_storage(PROBE_ACCOUNT, 0))
+    except FundingUnavailable:
+        return False
+    return True
+
+
+def balance_slot(token):
+    # Returns (slot, layout) of the balanceOf mapping of token
+    address = str(token)
+    if address in _balance_slots:
+        return _balance_slots[address]
+    for slot in range(MAX_PROBED_SLOT):
+        for layout in (SOLIDITY, VYPER):
+            position = _mapping_position(PROBE_ACCOUNT, slot, layout)
+            previous = _get_storage(address, position)
+            _set_storage(address, position, PROBE_VALUE)
+            found = token.balanceOf(PROBE_ACCOUNT) == PROBE_VALUE
+            _set_storage(address, position, previous)
+            if found:
+                _balance_slots[address] = (slot, layout)
+                return _balance_slots[address]
+    raise LookupError(f"balanceOf slot of {address} not found")
+
+
+def set_balance(token, account, balance):
+    slot, layout = balance_slot(token)
+    _set_storage(str(token), _mapping_position(account, slot, layout), balance)
+
+
+def fund(token, account, amount, whale=None):
+    # Adds amount to the token balance of account. Note that totalSupply is not
+    # updated, so only use this for tokens whose supply does not price anything
+    # under test (DAI, USDC). Falls back to a whale transfer on nodes that
+    # cannot write storage.
+    if not storage_writes_supported():
+        if whale is None:
+            raise FundingUnavailable("node cannot write storage and no whale given")
+        token.transfer(account, amount, {"from": whale})
+        return
+    set_balance(token, account, token.balanceOf(account) + amount)
+
+
+def fund_yieldBearing(yieldBearing, token, partnerToken, account, wantAmount, whale=None):
+    # G-UNI is valued off its totalSupply, so rather than writing its balance we
+    # fund both underlyings 1:1 in value and mint through the pool
+    partnerAmount = wantAmount * 10 ** partnerToken.decimals() // 10 ** token.decimals()
+    fund(token, account, wantAmount, whale)
+    fund(partnerToken, account, partnerAmount, whale)
+    token.approve(yieldBearing, 2 ** 256 - 1, {"from": account})
+    partnerToken.approve(yieldBearing, 2 ** 256 - 1, {"from": account})
+    mintAmount = yieldBearing.getMintAmounts(wantAmount, partnerAmount)[2]
+    yieldBearing.mint(mintAmount, account, {"from": account})
+    return mintAmount
+
+
+def fund_eth(account, amount):
+    # Gives gas money to impersonated contracts that cannot receive ETH
+    for method in ("evm_setAccountBalance", "hardhat_setBalance", "anvil_setBalance"):
+        try:
+            _rpc(method, [str(account), hex(amount)])
+            return True
+        except ValueError:
+            continue
+    return False
@@ -0,0 +1,168 @@
+from brownie import Contract, accounts
+from helpers.funding import fund_eth
+
+# The strategy talks to Maker through hardcoded mainnet addresses, so instead of
+# deploying a separate Maker the forked core contracts are taken over: the
+# pause proxy is a ward of the vat, spotter, jug, auto line and PSM and can move
+# the dust, line, price and rate knobs of an ilk and the PSM fees directly.
+
+WAD = 10 ** 18
+RAY = 10 ** 27
+RAD = 10 ** 45
+
+PAUSE_PROXY = "0xBE8E3e3618f7474F8cB1d074A26afFef007E98FB"
+VAT = "0x35D1b3F3D7966A1DFe207aa4514C12a259A0492B"
+SPOTTER = "0x65C79fcB50Ca1594B025960e539eD7A9a6D434A3"
+AUTO_LINE = "0xC7Bdd1F2B16447dcf3dE045C4a039A60EC2f0ba3"
+VOW = "0xA950524441892A31ebddF91d3cEEFa04Bf454466"
+FLASH = "0x1EB4CF3A948E7D72A198fe073cCb8C7a948cD853"
+PSM = "0x89B78CfA322F6C5dE0aBcEecab66Aee45393cC5A"
+
+VAT_ABI = [
+    {
+        "name": "ilks",
+        "type": "function",
+        "stateMutability": "view",
+        "inputs": [{"name": "", "type": "bytes32"}],
+        "outputs": [
+            {"name": "Art", "type": "uint256"},
+            {"name": "rate", "type": "uint256"},
+            {"name": "spot", "type": "uint256"},
+            {"name": "line", "type": "uint256"},
+            {"name": "dust", "type": "uint256"},
+        ],
+    },
+    {
+        "name": "file",
+        "type": "function",
+        "stateMutability": "nonpayable",
+        "inputs": [
+            {"name": "ilk", "type": "bytes32"},
+            {"name": "what", "type": "bytes32"},
+            {"name": "data", "type": "uint256"},
+        ],
+        "outputs": [],
+    },
+    {
+        "name": "fold",
+        "type": "function",
+        "stateMutability": "nonpayable",
+        "inputs": [
+            {"name": "i", "type": "bytes32"},
+            {"name": "u", "type": "address"},
+            {"name": "rate", "type": "int256"},
+        ],
+        "outputs": [],
+    },
+]
+SPOTTER_ABI = [
+    {
+        "name": "ilks",
+        "type": "function",
+        "stateMutability": "view",
+        "inputs": [{"name": "", "type": "bytes32"}],
+        "outputs": [{"name": "pip", "type": "address"}, {"name": "mat", "type": "uint256"}],
+    }
+]
+AUTO_LINE_ABI = [
+    {
+        "name": "remIlk",
+        "type": "function",
+        "stateMutability": "nonpayable",
+        "inputs": [{"name": "ilk", "type": "bytes32"}],
+        "outputs": [],
+    }
+]
+PSM_ABI = [
+    {
+        "name": "tin",
+        "type": "function",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"name": "", "type": "uint256"}],
+    },
+    {
+        "name": "file",
+        "type": "function",
+        "stateMutability": "nonpayable",
+        "inputs": [{"name": "what", "type": "bytes32"}, {"name": "data", "type": "uint256"}],
+        "outputs": [],
+    },
+]
+
+FLASH_ABI = [
+    {
+        "name": "FlashLoan",
+        "type": "event",
+        "anonymous": False,
+        "inputs": [
+            {"name": "receiver", "type": "address", "indexed": True},
+            {"name": "token", "type": "address", "indexed": False},
+            {"name": "amount", "type": "uint256", "indexed": False},
+            {"name": "fee", "type": "uint256", "indexed": False},
+        ],
+    }
+]
+
+
+def _bytes32(text):
+    return "0x" + text.encode().hex().ljust(64, "0")
+
+
+class MakerStandIn:
+    def __init__(self, ilk):
+        self.ilk = ilk
+        self.vat = Contract.from_abi("Vat", VAT, VAT_ABI)
+        self.spotter = Contract.from_abi("Spotter", SPOTTER, SPOTTER_ABI)
+        self.autoLine = Contract.from_abi("DssAutoLine", AUTO_LINE, AUTO_LINE_ABI)
+        self.psm = Contract.from_abi("DssPsm", PSM, PSM_ABI)
+        self.auth = accounts.at(PAUSE_PROXY, force=True)
+        fund_eth(self.auth, 10 * WAD)
+
+    def _file(self, what, data):
+        self.vat.file(self.ilk, _bytes32(what), data, {"from": self.auth})
+
+    def ilk_state(self):
+        return self.vat.ilks(self.ilk).dict()
+
+    def total_debt(self):
+        # Debt of the whole ilk in DAI [wad]
+        state = self.ilk_state()
+        return state["Art"] * state["rate"] // RAY
+
+    def set_dust(self, dai_amount):
+        self._file("dust", dai_amount * RAY)
+
+    def set_line(self, dai_amount):
+        # Remove the ilk from the auto line first, keepBasicMakerHygiene would reset it
+        self.autoLine.remIlk(self.ilk, {"from": self.auth})
+        self._file("line", dai_amount * RAY)
+
+    def set_available_to_mint(self, dai_amount):
+        self.set_line(self.total_debt() + dai_amount)
+
+    def set_price(self, price):
+        # Collateral price in DAI [wad], stored in the vat with the safety margin
+        mat = self.spotter.ilks(self.ilk)["mat"]
+        self._file("spot", price * RAY // WAD * RAY // mat)
+
+    def price(self):
+        mat = self.spotter.ilks(self.ilk)["mat"]
+        return self.ilk_state()["spot"] * mat // RAY * WAD // RAY
+
+    def accrue_stability_fee(self, fraction):
+        # Grows every urn's debt by fraction at once instead of waiting for the jug
+        rate = self.ilk_state()["rate"]
+        self.vat.fold(self.ilk, VOW, int(rate * fraction), {"from": self.auth})
+
+    def set_tin(self, fee):
+        # Fee sellGem takes from USDC sold for DAI [wad], 0.001e18 is 0.1%
+        self.psm.file(_bytes32("tin"), fee, {"from": self.auth})
+
+
+def flashminted(tx):
+    # Loading the ABI lets brownie decode the flashmint module's events
+    Contract.from_abi("DssFlash", FLASH, FLASH_ABI)
+    if "FlashLoan" not in tx.events:
+        return []
+    return [event["amount"] for event in tx.events["FlashLoan"] if event.address == FLASH]
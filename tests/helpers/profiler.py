@@ -0,0 +1,203 @@
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+from brownie import history, web3
+
+# Records wall time and RPC calls per fixture setup/teardown and per test phase,
+# plus gas and transactions per test. Enabled with `brownie test --timing`.
+# Writes a JSON report and a folded-stack trace that flamegraph.pl, speedscope
+# or inferno can render directly.
+
+REPORT_NAME = "test-timing.json"
+TRACE_NAME = "test-timing.folded"
+# RPC methods that only move the chain forward (chain.sleep / chain.mine)
+CHAIN_METHODS = {"evm_increaseTime", "evm_mine"}
+
+
+class RpcCounter:
+    def __init__(self):
+        self.total = 0
+        self.by_method = defaultdict(int)
+        self._make_request = None
+
+    def install(self):
+        # brownie connects to the network after the session starts
+        if self._make_request is not None or web3.provider is None:
+            return
+        provider = web3.provider
+        self._make_request = provider.make_request
+
+        def make_request(method, params):
+            self.total += 1
+            self.by_method[method] += 1
+            return self._make_request(method, params)
+
+        provider.make_request = make_request
+
+    def uninstall(self):
+        if self._make_request is not None:
+            web3.provider.make_request = self._make_request
+            self._make_request = None
+
+    def snapshot(self):
+        return self.total, sum(self.by_method.get(m, 0) for m in CHAIN_METHODS)
+
+
+class Sample:
+    def __init__(self, counter):
+        self.counter = counter
+        self.start = time.perf_counter()
+        self.rpc, self.chain = counter.snapshot()
+
+    def stop(self):
+        rpc, chain = self.counter.snapshot()
+        return {
+            "seconds": time.perf_counter() - self.start,
+            "rpc": rpc - self.rpc,
+            "chain_rpc": chain - self.chain,
+        }
+
+
+class TimingProfiler:
+    def __init__(self, output):
+        self.output = Path(output)
+        self.counter = RpcCounter()
+        self.fixtures = defaultdict(lambda: defaultdict(float))
+        self.tests = {}
+        self.folded = defaultdict(float)
+        self._current = None
+        self._history_start = {}
+
+    def _record_fixture(self, fixturedef, phase, sample):
+        stats = self.fixtures[f"{fixturedef.argname} ({fixturedef.scope})"]
+        result = sample.stop()
+        stats[f"{phase}_count"] += 1
+        stats[f"{phase}_seconds"] += result["seconds"]
+        stats[f"{phase}_rpc"] += result["rpc"]
+        stats[f"{phase}_chain_rpc"] += result["chain_rpc"]
+        self._fold(phase, fixturedef.argname, result["seconds"])
+
+    def _fold(self, phase, frame, seconds):
+        stack = [self._current or "session", phase]
+        if frame:
+            stack.append(frame)
+        # folded stacks take integer sample counts, use microseconds
+        self.folded[";".join(stack)] += seconds * 1e6
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        # Finalizers run LIFO: the first one added here runs after the fixture's
+        # own teardown, the last one before it, which brackets the teardown.
+        teardown = {}
+
+        def teardown_end():
+            if "sample" in teardown:
+                self._record_fixture(fixturedef, "teardown", teardown.pop("sample"))
+
+        fixturedef.addfinalizer(teardown_end)
+        sample = Sample(self.counter)
+        yield
+        self._record_fixture(fixturedef, "setup", sample)
+        fixturedef.addfinalizer(lambda: teardown.update(sample=Sample(self.counter)))
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        self.counter.install()
+        self._current = item.nodeid
+        self.tests[item.nodeid] = {}
+        self._history_start[item.nodeid] = len(history)
+        yield
+        self._current = None
+
+    def _phase(self, item, phase):
+        sample = Sample(self.counter)
+        yield
+        result = sample.stop()
+        self.tests[item.nodeid][phase] = result
+        self._fold(phase, None, result["seconds"])
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        yield from self._phase(item, "setup")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        yield from self._phase(item, "call")
+        # the isolation fixture reverts the chain on teardown, so count transactions now
+        txs = history[self._history_start[item.nodeid] :]
+        self.tests[item.nodeid]["transactions"] = len(txs)
+        self.tests[item.nodeid]["gas_used"] = sum(tx.gas_used or 0 for tx in txs)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        yield from self._phase(item, "teardown")
+
+    def pytest_sessionfinish(self, session):
+        self.counter.uninstall()
+        self.output.mkdir(parents=True, exist_ok=True)
+        report = {
+            "fixtures": self.fixtures,
+            "tests": self.tests,
+            "rpc_by_method": self.counter.by_method,
+        }
+        with self.output.joinpath(REPORT_NAME).open("w") as fp:
+            json.dump(report, fp, indent=2, sort_keys=True)
+        with self.output.joinpath(TRACE_NAME).open("w") as fp:
+            for stack, micros in sorted(self.folded.items()):
+                # flamegraph frames can not contain spaces
+                fp.write(f"{stack.replace(' ', '_')} {int(micros)}\n")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        write = terminalreporter.write_line
+        terminalreporter.section("fixture timing")
+        fixtures = sorted(
+            self.fixtures.items(),
+            key=lambda i: i[1]["setup_seconds"] + i[1]["teardown_seconds"],
+            reverse=True,
+        )
+        write(f"{'fixture':<45}{'count':>7}{'setup s':>10}{'teardown s':>12}{'rpc':>8}{'chain':>7}")
+        for name, stats in fixtures:
+            write(
+                f"{name:<45}{int(stats['setup_count']):>7}{stats['setup_seconds']:>10.2f}"
+                f"{stats['teardown_seconds']:>12.2f}"
+                f"{int(stats['setup_rpc'] + stats['teardown_rpc']):>8}"
+                f"{int(stats['setup_chain_rpc'] + stats['teardown_chain_rpc']):>7}"
+            )
+        terminalreporter.section("test timing")
+        tests = sorted(
+            self.tests.items(),
+            key=lambda i: sum(i[1].get(p, {}).get("seconds", 0) for p in ("setup", "call", "teardown")),
+            reverse=True,
+        )
+        write(f"{'test':<60}{'setup s':>9}{'call s':>9}{'rpc':>7}{'txs':>6}{'gas':>12}")
+        for nodeid, stats in tests:
+            setup, call = stats.get("setup", {}), stats.get("call", {})
+            write(
+                f"{nodeid[-60:]:<60}{setup.get('seconds', 0):>9.2f}{call.get('seconds', 0):>9.2f}"
+                f"{setup.get('rpc', 0) + call.get('rpc', 0):>7}"
+                f"{stats.get('transactions', 0):>6}{stats.get('gas_used', 0):>12}"
+            )
+        write(f"reports written to {self.output}/{REPORT_NAME} and {TRACE_NAME}")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--timing",
+        action="store_true",
+        help="Profile wall time, RPC calls and gas per fixture and test phase",
+    )
+    parser.addoption(
+        "--timing-output",
+        default="reports",
+        help="Directory for the timing report and folded-stack trace",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("timing"):
+        config.pluginmanager.register(
+            TimingProfiler(config.getoption("timing_output")), "timing-profiler"
+        )
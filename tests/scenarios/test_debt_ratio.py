@@ -0,0 +1,65 @@
+import pytest
+
+from brownie import chain
+
+
+def test_increase(vault, strategy, gov, token, user, amount, RELATIVE_APPROX_LOSSY):
+    token.approve(vault, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    vault.updateStrategyDebtRatio(strategy, 5_000, {"from": gov})
+
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    assert vault.strategies(strategy).dict()["totalDebt"] == amount // 2
+
+    chain.sleep(1)
+    vault.updateStrategyDebtRatio(strategy, 10_000, {"from": gov})
+    strategy.harvest({"from": gov})
+    assert (
+        pytest.approx(vault.strategies(strategy).dict()["totalDebt"], rel=RELATIVE_APPROX_LOSSY)
+        == amount
+    )
+    assert vault.strategies(strategy).dict()["totalLoss"] == 0
+    assert (
+        pytest.approx(strategy.getCurrentMakerVaultRatio(), rel=RELATIVE_APPROX_LOSSY)
+        == strategy.collateralizationRatio()
+    )
+
+
+def test_decrease(vault, strategy, gov, token, user, amount, RELATIVE_APPROX_LOSSY):
+    token.approve(vault, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    assert vault.strategies(strategy).dict()["totalDebt"] == amount
+
+    chain.sleep(1)
+    vault.updateStrategyDebtRatio(strategy, 5_000, {"from": gov})
+    strategy.harvest({"from": gov})
+
+    assert (
+        pytest.approx(vault.strategies(strategy).dict()["totalDebt"], rel=RELATIVE_APPROX_LOSSY)
+        == amount // 2
+    )
+    assert vault.strategies(strategy).dict()["totalLoss"] < amount * RELATIVE_APPROX_LOSSY
+
+
+def test_gradual_decrease(vault, strategy, gov, token, user, amount, RELATIVE_APPROX_LOSSY):
+    token.approve(vault, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+    lastDebt = vault.strategies(strategy).dict()["totalDebt"]
+    for debtRatio in [9_000, 7_500, 5_000, 2_500, 1_000]:
+        vault.updateStrategyDebtRatio(strategy, debtRatio, {"from": gov})
+        chain.sleep(1)
+        strategy.harvest({"from": gov})
+        totalDebt = vault.strategies(strategy).dict()["totalDebt"]
+        assert totalDebt < lastDebt
+        lastDebt = totalDebt
+
+    assert (
+        pytest.approx(lastDebt, rel=RELATIVE_APPROX_LOSSY) == amount // 10
+    )
+    assert vault.strategies(strategy).dict()["totalLoss"] < amount * RELATIVE_APPROX_LOSSY
@@ -0,0 +1,239 @@
+import pytest
+
+from brownie import chain
+
+# Dust and debt ceiling of the ilk are moved through the maker stand-in, so
+# the floor and ceiling paths run with the regular 50k/100k deposits
+
+
+def test_small_deposit_does_not_generate_debt_under_floor(
+    vault, test_strategy, token, user, amount, maker, gov
+):
+    # 50k of want levers up to ~2.2M of debt, keep the floor above that
+    maker.set_dust(5_000_000 * 10 ** 18)
+
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    test_strategy.harvest({"from": gov})
+
+    # Winding under the floor is skipped and the want stays loose
+    assert test_strategy.balanceOfDebt() == 0
+    assert test_strategy.balanceOfMakerVault() == 0
+    assert token.balanceOf(test_strategy) == amount
+    assert test_strategy.getCurrentMakerVaultRatio() == 0
+    assert test_strategy.tendTrigger(1) == False
+
+
+def test_deposit_after_passing_debt_floor_generates_debt(
+    vault, test_strategy, token, user, user2, amount, amount2, maker, gov, RELATIVE_APPROX
+):
+    maker.set_dust(5_000_000 * 10 ** 18)
+
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    test_strategy.harvest({"from": gov})
+    assert test_strategy.balanceOfDebt() == 0
+
+    # Deposit enough want to go over the dust
+    token.approve(vault.address, amount2, {"from": user2})
+    vault.deposit(amount2, {"from": user2})
+    chain.sleep(1)
+    test_strategy.harvest({"from": gov})
+
+    assert test_strategy.balanceOfDebt() > 5_000_000 * 10 ** 18
+    assert token.balanceOf(test_strategy) == 0
+    assert (
+        pytest.approx(test_strategy.getCurrentMakerVaultRatio(), rel=RELATIVE_APPROX)
+        == test_strategy.collateralizationRatio()
+    )
+
+
+def test_withdraw_does_not_leave_debt_under_floor(
+    vault, test_strategy, token, user, amount, maker, gov
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    test_strategy.harvest({"from": gov})
+    assert test_strategy.balanceOfDebt() > 0
+
+    # Remaining ~5% of the position would only carry ~110k of debt
+    maker.set_dust(1_000_000 * 10 ** 18)
+    vault.withdraw(vault.balanceOf(user) * 95 // 100, user, 100, {"from": user})
+
+    # Instead of leaving debt under the floor the whole position is closed
+    assert test_strategy.balanceOfDebt() == 0
+    assert test_strategy.balanceOfMakerVault() == 0
+    assert test_strategy.getCurrentMakerVaultRatio() == 0
+    assert token.balanceOf(test_strategy) > 0
+
+
+def test_below_band_tend_with_debt_just_above_floor_closes_the_position(
+    vault, test_strategy, token, user, amount, maker, gov, RELATIVE_APPROX_LOSSY
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    test_strategy.harvest({"from": gov})
+
+    # Repaying down to the new target would leave the debt under the floor,
+    # and re-drawing at the target alone does not cover the full flashmint
+    maker.set_dust(test_strategy.balanceOfDebt() * 99 // 100)
+    test_strategy.setCollateralizationRatio(1.026e18, {"from": gov})
+    assert test_strategy.tendTrigger(1) == True
+    test_strategy.tend({"from": gov})
+
+    assert test_strategy.balanceOfDebt() == 0
+    assert pytest.approx(test_strategy.estimatedTotalAssets(), rel=RELATIVE_APPROX_LOSSY) == amount
+
+
+def test_large_deposit_does_not_generate_debt_over_ceiling(
+    vault, test_strategy, token, user, amount, maker, gov
+):
+    # Leave room for 100k of DAI, well below the ~2.2M the deposit asks for
+    available = 100_000 * 10 ** 18
+    maker.set_available_to_mint(available)
+
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    test_strategy.harvest({"from": gov})
+
+    assert 0 < test_strategy.balanceOfDebt() <= available
+    assert token.balanceOf(test_strategy) == 0
+    assert token.balanceOf(vault) == 0
+
+    # Collateral ratio is larger due to debt being capped by the ceiling
+    assert test_strategy.getCurrentMakerVaultRatio() > (
+        test_strategy.collateralizationRatio() + test_strategy.upperRebalanceTolerance()
+    )
+    # Nothing left to mint, so tending above the band is pointless
+    assert test_strategy.tendTrigger(1) == False
+
+
+def test_deposit_at_debt_ceiling_does_not_generate_debt(
+    vault, test_strategy, token, user, amount, maker, gov
+):
+    maker.set_available_to_mint(0)
+
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    test_strategy.harvest({"from": gov})
+
+    assert test_strategy.balanceOfDebt() == 0
+    assert token.balanceOf(test_strategy) == amount
+
+
+def test_large_want_balance_does_not_generate_debt_over_ceiling(
+    vault, test_strategy, token, user, amount, maker, gov
+):
+    # Wind the whole balance in one go
+    test_strategy.setMinMaxSingleTrade(test_strategy.minSingleTrade(), 2 ** 120 - 1, {"from": gov})
+    available = 100_000 * 10 ** 18
+    maker.set_available_to_mint(available)
+
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    test_strategy.harvest({"from": gov})
+
+    assert 0 < test_strategy.balanceOfDebt() <= available
+    assert token.balanceOf(test_strategy) == 0
+    assert token.balanceOf(vault) == 0
+    assert test_strategy.getCurrentMakerVaultRatio() > (
+        test_strategy.collateralizationRatio() + test_strategy.upperRebalanceTolerance()
+    )
+
+
+def test_withdraw_everything_cancels_entire_debt(
+    vault, test_strategy, token, user, user2, amount, amount2, gov
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    token.approve(vault.address, amount2, {"from": user2})
+    vault.deposit(amount2, {"from": user2})
+    chain.sleep(1)
+    test_strategy.harvest({"from": gov})
+
+    vault.withdraw(vault.balanceOf(user2), user2, 100, {"from": user2})
+    vault.withdraw(vault.balanceOf(user), user, 500, {"from": user})
+
+    assert vault.strategies(test_strategy).dict()["totalDebt"] == 0
+    assert test_strategy.balanceOfDebt() == 0
+    assert test_strategy.balanceOfMakerVault() == 0
+
+
+def test_small_withdraw_cancels_corresponding_debt(
+    vault, test_strategy, token, user, amount, gov, RELATIVE_APPROX_LOSSY
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    test_strategy.harvest({"from": gov})
+    debt_before = test_strategy.balanceOfDebt()
+    collateral_before = test_strategy.balanceOfMakerVault()
+
+    # Withdraw 20% of the position
+    vault.withdraw(vault.balanceOf(user) // 5, user, 100, {"from": user})
+
+    assert pytest.approx(token.balanceOf(user), rel=RELATIVE_APPROX_LOSSY) == amount // 5
+    assert pytest.approx(test_strategy.balanceOfDebt(), rel=RELATIVE_APPROX_LOSSY) == debt_before * 4 // 5
+    assert (
+        pytest.approx(test_strategy.balanceOfMakerVault(), rel=RELATIVE_APPROX_LOSSY)
+        == collateral_before * 4 // 5
+    )
+
+
+def test_tend_trigger_with_debt_under_dust_returns_false(
+    vault, test_strategy, token, user, amount, maker, gov
+):
+    maker.set_dust(5_000_000 * 10 ** 18)
+
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    test_strategy.harvest({"from": gov})
+
+    # The loose want can not be wound above the floor, so a tend would do nothing
+    assert test_strategy.balanceOfDebt() == 0
+    assert test_strategy.undeployedWant() == amount
+    assert test_strategy.tendTrigger(1) == False
+
+
+def test_tend_trigger_without_more_mintable_dai_returns_false(
+    vault, test_strategy, token, user, user2, amount, amount2, maker, gov
+):
+    maker.set_available_to_mint(100_000 * 10 ** 18)
+
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    test_strategy.harvest({"from": gov})
+
+    assert test_strategy.tendTrigger(1) == False
+
+    token.approve(vault.address, amount2, {"from": user2})
+    vault.deposit(amount2, {"from": user2})
+    chain.sleep(1)
+    test_strategy.harvest({"from": gov})
+
+    assert test_strategy.tendTrigger(1) == False
+
+
+def test_tend_trigger_with_funds_in_cdp_but_no_debt_returns_false(
+    vault, test_strategy, token, user, amount, gov
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    test_strategy.harvest({"from": gov})
+    assert test_strategy.tendTrigger(1) == False
+
+    test_strategy.emergencyDeleverage(1e18, {"from": gov})
+
+    assert test_strategy.balanceOfDebt() == 0
+    assert test_strategy.balanceOfMakerVault() > 0
+    assert test_strategy.tendTrigger(1) == False
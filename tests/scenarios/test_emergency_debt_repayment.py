@@ -0,0 +1,233 @@
+import pytest
+
+from brownie import chain, reverts
+from helpers.funding import set_balance, storage_writes_supported
+from helpers.maker import flashminted
+
+
+def test_repayment_frees_want_and_reduces_debt(
+    vault, strategy, token, user, amount, gov, RELATIVE_APPROX_LOSSY
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    debtBefore = strategy.balanceOfDebt()
+
+    repayAmount = amount // 4
+    strategy.emergencyDebtRepayment(repayAmount, {"from": gov})
+
+    assert pytest.approx(token.balanceOf(strategy), rel=RELATIVE_APPROX_LOSSY) == repayAmount
+    assert strategy.balanceOfDebt() < debtBefore
+
+
+def test_price_drop_triggers_tend(vault, strategy, token, user, amount, maker, gov):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    assert strategy.getCurrentMakerVaultRatio() > (
+        strategy.collateralizationRatio() - strategy.lowerRebalanceTolerance()
+    )
+
+    # The pessimistic ratio follows the lower Maker price, half a percent
+    # takes it below the lower rebalance band
+    maker.set_price(maker.price() * 995 // 1000)
+
+    assert strategy.getCurrentMakerVaultRatio() < (
+        strategy.collateralizationRatio() - strategy.lowerRebalanceTolerance()
+    )
+    assert strategy.tendTrigger(1) == True
+
+
+def test_emergency_exit_after_price_drop_repays_all_debt(
+    vault, strategy, token, user, amount, maker, gov, RELATIVE_APPROX_LOSSY
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+    maker.set_price(maker.price() * 995 // 1000)
+
+    strategy.setEmergencyExit({"from": gov})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+    assert strategy.balanceOfDebt() == 0
+    assert strategy.balanceOfMakerVault() == 0
+    assert pytest.approx(token.balanceOf(vault), rel=RELATIVE_APPROX_LOSSY) == amount
+
+
+def test_emergency_deleverage_repays_debt_share(
+    vault, strategy, token, user, amount, maker, gov, RELATIVE_APPROX_LOSSY
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    debtBefore = strategy.balanceOfDebt()
+
+    maker.set_price(maker.price() * 995 // 1000)
+    ratioBefore = strategy.getCurrentMakerVaultRatio()
+
+    # A quarter of the debt in one partial flashmint, nothing is re-locked
+    strategy.emergencyDeleverage(0.25e18, {"from": gov})
+
+    assert pytest.approx(strategy.balanceOfDebt(), rel=RELATIVE_APPROX_LOSSY) == debtBefore * 3 // 4
+    assert strategy.getCurrentMakerVaultRatio() > ratioBefore
+    assert strategy.tendTrigger(1) == False
+
+    strategy.emergencyDeleverage(1e18, {"from": gov})
+    assert strategy.balanceOfDebt() == 0
+
+
+def test_emergency_deleverage_with_psm_fee_and_no_loose_dai(
+    vault, strategy, token, user, amount, maker, gov, RELATIVE_APPROX_LOSSY
+):
+    if not storage_writes_supported():
+        pytest.skip("node cannot write storage to clear the loose DAI")
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    debtBefore = strategy.balanceOfDebt()
+
+    # Nothing loose to cover the shortfall: the burn alone has to repay the flashmint
+    set_balance(token, strategy, 0)
+    maker.set_tin(0.001e18)
+    strategy.emergencyDeleverage(0.25e18, {"from": gov})
+
+    assert pytest.approx(strategy.balanceOfDebt(), rel=RELATIVE_APPROX_LOSSY) == debtBefore * 3 // 4
+    # Only the tin gross-up and the rounding margin are left over
+    assert strategy.balanceOfWant() < debtBefore // 4 * 2 // 1000
+
+
+# Gas of the emergency path next to the full unwind (Action.UNWIND) that
+# emergencyDebtRepayment takes to repay the whole debt: it wipes everything,
+# burns the request and re-locks or sells what is left. Both flashmint D + 1.
+# Run with -s to see the numbers.
+def test_emergency_deleverage_gas_against_full_unwind(
+    vault, strategy, token, user, amount, maker, gov
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    maker.set_price(maker.price() * 995 // 1000)
+    debtBefore = strategy.balanceOfDebt()
+
+    emergency = strategy.emergencyDeleverage(1e18, {"from": gov})
+    assert strategy.balanceOfDebt() == 0
+    # Only the collateral that repays the debt is freed, the rest stays locked
+    assert strategy.balanceOfMakerVault() > 0
+    chain.undo()
+
+    # At the current ratio, requesting D * (r - 1) repays D, ask a bit more to take the full path
+    ratio = strategy.getCurrentMakerVaultRatio()
+    repayAmountOfWant = debtBefore * (ratio - 10 ** 18) // 10 ** 18 + 10 ** 18
+    full = strategy.emergencyDebtRepayment(repayAmountOfWant, {"from": gov})
+    assert strategy.balanceOfDebt() == 0
+
+    assert flashminted(emergency) == flashminted(full) == [debtBefore + 1]
+    print(f"\nemergencyDeleverage gas: {emergency.gas_used}, full unwind gas: {full.gas_used}")
+    assert emergency.gas_used < full.gas_used
+
+
+def test_passing_zero_repays_nothing(vault, strategy, token, user, amount, gov):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    debt_before = strategy.balanceOfDebt()
+    collateral_before = strategy.balanceOfMakerVault()
+
+    # Nothing requested at the current ratio means nothing to flashmint
+    strategy.emergencyDebtRepayment(0, {"from": gov})
+
+    assert strategy.balanceOfDebt() == debt_before
+    assert strategy.balanceOfMakerVault() == collateral_before
+
+
+def test_full_deleverage_repays_all_debt_then_harvest_levers_up_again(
+    vault, strategy, token, user, amount, gov, RELATIVE_APPROX
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+    strategy.emergencyDeleverage(1e18, {"from": gov})
+
+    # All debt is repaid, the collateral that was not needed stays locked
+    assert strategy.balanceOfDebt() == 0
+    assert strategy.balanceOfMakerVault() > 0
+
+    # Re-harvest with the same funds
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    assert strategy.balanceOfDebt() > 0
+    assert (
+        pytest.approx(strategy.getCurrentMakerVaultRatio(), rel=RELATIVE_APPROX)
+        == strategy.collateralizationRatio()
+    )
+
+
+def test_full_deleverage_then_new_deposit_creates_debt_again(
+    vault, strategy, token, user, user2, amount, amount2, gov, RELATIVE_APPROX
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+    strategy.emergencyDeleverage(1e18, {"from": gov})
+    assert strategy.balanceOfDebt() == 0
+
+    token.approve(vault.address, amount2, {"from": user2})
+    vault.deposit(amount2, {"from": user2})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+    assert strategy.balanceOfDebt() > 0
+    assert strategy.balanceOfWant() < amount2 // 10_000
+    assert (
+        pytest.approx(strategy.getCurrentMakerVaultRatio(), rel=RELATIVE_APPROX)
+        == strategy.collateralizationRatio()
+    )
+
+
+def test_passing_share_over_whole_debt_does_nothing(vault, strategy, token, user, amount, gov):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    debt_before = strategy.balanceOfDebt()
+    collateral_before = strategy.balanceOfMakerVault()
+
+    with reverts():
+        strategy.emergencyDeleverage(1e18 + 1, {"from": gov})
+
+    assert strategy.balanceOfDebt() == debt_before
+    assert strategy.balanceOfMakerVault() == collateral_before
+
+
+def test_share_adjusts_debt(
+    vault, strategy, token, user, amount, gov, RELATIVE_APPROX, RELATIVE_APPROX_LOSSY
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    debt_before = strategy.balanceOfDebt()
+    collateral_before = strategy.balanceOfMakerVault()
+    price = strategy.getWantPerYieldBearing()
+
+    strategy.emergencyDeleverage(0.3e18, {"from": gov})
+
+    # 30% of the debt is repaid with collateral worth about the same, plus the PSM fee
+    assert pytest.approx(strategy.balanceOfDebt(), rel=RELATIVE_APPROX) == debt_before * 0.7
+    assert (
+        pytest.approx(strategy.balanceOfMakerVault(), rel=RELATIVE_APPROX_LOSSY)
+        == collateral_before - debt_before * 0.3 * 1e18 / price
+    )
@@ -0,0 +1,60 @@
+import pytest
+
+from brownie import chain
+from helpers.funding import fund
+
+
+def test_liquidates_all_if_exact_same_want_balance(test_strategy, token, token_whale):
+    amount = 100 * 10 ** token.decimals()
+    fund(token, test_strategy, amount, token_whale)
+
+    (_liquidatedAmount, _loss) = test_strategy._liquidatePosition(amount).return_value
+    assert _liquidatedAmount == amount
+    assert _loss == 0
+
+
+def test_liquidates_all_if_has_more_want_balance(test_strategy, token, token_whale):
+    amount = 50 * 10 ** token.decimals()
+    fund(token, test_strategy, amount, token_whale)
+
+    amountToLiquidate = amount // 2
+    (_liquidatedAmount, _loss) = test_strategy._liquidatePosition(
+        amountToLiquidate
+    ).return_value
+    assert _liquidatedAmount == amountToLiquidate
+    assert _loss == 0
+
+
+def test_liquidate_more_than_we_have_should_report_loss(
+    test_strategy, token, token_whale
+):
+    amount = 50 * 10 ** token.decimals()
+    fund(token, test_strategy, amount, token_whale)
+
+    amountToLiquidate = amount * 3 // 2
+    (_liquidatedAmount, _loss) = test_strategy._liquidatePosition(
+        amountToLiquidate
+    ).return_value
+    assert _liquidatedAmount == amount
+    assert _loss == (amountToLiquidate - amount)
+
+
+# Stability fees grow the debt without growing the collateral, so closing the
+# whole position afterwards has to report the accrued fees as a loss
+def test_liquidate_position_after_stability_fee_reports_loss(
+    token, vault, test_strategy, user, amount, maker, gov
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    test_strategy.harvest({"from": gov})
+
+    debtBefore = test_strategy.balanceOfDebt()
+    maker.accrue_stability_fee(0.001)
+    assert test_strategy.balanceOfDebt() > debtBefore
+
+    (_liquidatedAmount, _loss) = test_strategy._liquidatePosition(amount).return_value
+    assert _liquidatedAmount + _loss == amount
+    assert _loss > 0
+    assert test_strategy.balanceOfDebt() == 0
+    assert token.balanceOf(test_strategy) < amount
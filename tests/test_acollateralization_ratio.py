@@ -1,5 +1,6 @@
 import pytest
 from brownie import chain, reverts, Wei
+from helpers.maker import flashminted
 
 
 
@@ -248,6 +249,93 @@ def test_higher_target_ratio_should_repay_debt(
     # will be repaid to maintain a healthy ratio
 
 
+def test_lower_target_ratio_should_take_more_debt_in_single_flashmint(
+    vault, strategy, token, amount, user, gov, RELATIVE_APPROX
+):
+    strategy.setCollateralizationRatio(1.05e18, {"from": gov})
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    debtBefore = strategy.balanceOfDebt()
+
+    strategy.setCollateralizationRatio(1.023e18, {"from": gov})
+    assert strategy.tendTrigger(1) == True
+
+    # Above the band the strategy levers up with one flashmint and one frob
+    tend_tx = strategy.tend({"from": gov})
+    assert len(flashminted(tend_tx)) == 1
+
+    assert strategy.balanceOfDebt() > debtBefore
+    assert (pytest.approx(strategy.collateralizationRatio(), rel=RELATIVE_APPROX) == strategy.getCurrentMakerVaultRatio())
+
+
+def test_higher_target_ratio_repays_debt_without_freeing_want(
+    vault, strategy, token, amount, user, gov, RELATIVE_APPROX, RELATIVE_APPROX_LOSSY
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    debt = strategy.balanceOfDebt()
+    ratio = strategy.getCurrentMakerVaultRatio()
+
+    target = 1.026e18
+    strategy.setCollateralizationRatio(target, {"from": gov})
+    tend_tx = strategy.tend({"from": gov})
+
+    # Only F = (r*D - C*p) / (r - 1) is repaid, nothing is taken out as loose want
+    loans = flashminted(tend_tx)
+    assert len(loans) == 1
+    assert pytest.approx(loans[0], rel=RELATIVE_APPROX_LOSSY) == (target - ratio) * debt / (target - 1e18)
+    assert strategy.balanceOfWant() < amount // 10_000
+    assert strategy.tendTrigger(0) == False
+    assert (pytest.approx(strategy.collateralizationRatio(), rel=RELATIVE_APPROX) == strategy.getCurrentMakerVaultRatio())
+
+
+def test_releverage_trigger_weighs_expected_yield_against_call_cost(
+    vault, strategy, token, amount, user, gov
+):
+    strategy.setCollateralizationRatio(1.05e18, {"from": gov})
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    strategy.setCollateralizationRatio(1.023e18, {"from": gov})
+
+    # 20% G-UNI yield over 30 days on the extra debt pays for a cheap call, not for 1000 ETH
+    strategy.setTendProfitability(0.2e18, 30 * 24 * 3600, {"from": gov})
+    assert strategy.tendTrigger(1e15) == True
+    assert strategy.tendTrigger(1000e18) == False
+
+    # Never worth it if the collateral yields less than the stability fee
+    strategy.setTendProfitability(1, 30 * 24 * 3600, {"from": gov})
+    assert strategy.tendTrigger(1) == False
+
+    # 0 turns the check off
+    strategy.setTendProfitability(0, 30 * 24 * 3600, {"from": gov})
+    assert strategy.tendTrigger(1000e18) == True
+
+
+def test_releverage_with_spot_below_gUNI_price_stays_in_band(
+    vault, strategy, token, amount, user, gov, maker, RELATIVE_APPROX
+):
+    strategy.setCollateralizationRatio(1.05e18, {"from": gov})
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    strategy.setCollateralizationRatio(1.023e18, {"from": gov})
+
+    # Maker values the collateral 0.5% under the G-UNI price, the releverage is sized against the lower one
+    maker.set_price(strategy.getWantPerYieldBearing() * 995 // 1000)
+    assert strategy.tendTrigger(1) == True
+    strategy.tend({"from": gov})
+
+    assert pytest.approx(strategy.getCurrentMakerVaultRatio(), rel=RELATIVE_APPROX) == strategy.collateralizationRatio()
+    assert strategy.tendTrigger(1) == False
+
+
 def test_higher_ratio_inside_rebalancing_band_should_not_repay_debt(
     vault, test_strategy, token, amount, user, gov, RELATIVE_APPROX
 ):
@@ -0,0 +1,91 @@
+from brownie import chain
+from brownie.test import strategy
+from helpers.funding import fund
+
+# Stateful fuzzing of the hand written deposit -> harvest -> withdraw -> "REPEAT!"
+# sequences in test_acollateralization_ratio.py. Brownie reverts the chain to a
+# single snapshot after every example, so each example only pays for its own
+# transactions.
+
+MAX_EXAMPLES = 50
+STEPS_PER_EXAMPLE = 10
+
+
+class CollateralizationRatioStateMachine:
+    # deposits between 1k and 2M DAI
+    deposit_amount = strategy("uint256", min_value=1_000, max_value=2_000_000)
+    # share of the user's vault shares to withdraw in basis points
+    withdraw_bps = strategy("uint256", min_value=1, max_value=10_000)
+    # new target collateralization ratio in basis points
+    ratio_bps = strategy("uint256", min_value=10_230, max_value=11_000)
+
+    def __init__(cls, vault, strategy, token, token_whale, user, gov, RELATIVE_APPROX_LOSSY):
+        cls.vault = vault
+        cls.strategy = strategy
+        cls.token = token
+        cls.token_whale = token_whale
+        cls.user = user
+        cls.gov = gov
+        cls.max_loss = RELATIVE_APPROX_LOSSY
+        cls.unit = 10 ** token.decimals()
+        token.approve(vault, 2 ** 256 - 1, {"from": user})
+
+    def setup(self):
+        self.deposited = 0
+        # setCollateralizationRatio moves the target, only a harvest or tend rebalances
+        self.pending_rebalance = False
+
+    def rule_deposit(self, deposit_amount):
+        amount = deposit_amount * self.unit
+        fund(self.token, self.user, amount, self.token_whale)
+        self.vault.deposit(amount, {"from": self.user})
+        self.deposited += amount
+
+    def rule_withdraw(self, withdraw_bps):
+        shares = self.vault.balanceOf(self.user) * withdraw_bps // 10_000
+        if shares == 0:
+            return
+        # 1% maxLoss
+        self.vault.withdraw(shares, self.user, 100, {"from": self.user})
+        self.pending_rebalance = False
+
+    def rule_harvest(self):
+        chain.sleep(1)
+        self.strategy.harvest({"from": self.gov})
+        self.pending_rebalance = False
+
+    def rule_tend(self):
+        self.strategy.tend({"from": self.gov})
+        self.pending_rebalance = False
+
+    def rule_set_collateralization_ratio(self, ratio_bps):
+        self.strategy.setCollateralizationRatio(ratio_bps * 10 ** 14, {"from": self.gov})
+        self.pending_rebalance = True
+
+    def invariant_collateralization_ratio_above_lower_band(self):
+        if self.pending_rebalance or self.strategy.balanceOfDebt() == 0:
+            return
+        assert (
+            self.strategy.getCurrentMakerVaultRatio()
+            > self.strategy.collateralizationRatio() - self.strategy.lowerRebalanceTolerance()
+        )
+
+    def invariant_bounded_loss(self):
+        totalLoss = self.vault.strategies(self.strategy).dict()["totalLoss"]
+        assert totalLoss <= self.deposited * self.max_loss
+
+
+def test_collateralization_ratio_stateful(
+    state_machine, vault, strategy, token, token_whale, user, gov, RELATIVE_APPROX_LOSSY
+):
+    state_machine(
+        CollateralizationRatioStateMachine,
+        vault,
+        strategy,
+        token,
+        token_whale,
+        user,
+        gov,
+        RELATIVE_APPROX_LOSSY,
+        settings={"max_examples": MAX_EXAMPLES, "stateful_step_count": STEPS_PER_EXAMPLE},
+    )
@@ -13,6 +13,8 @@ def test_migration(
     amount,
     Strategy,
     strategist,
+    ilk_yieldBearing,
+    gemJoinAdapter,
     gov,
     user,
     RELATIVE_APPROX,
@@ -25,7 +27,7 @@ def test_migration(
     assert pytest.approx(strategy.estimatedTotalAssets(), rel=RELATIVE_APPROX) == amount
 
     # migrate to a new strategy
-    new_strategy = strategist.deploy(Strategy, vault, "StrategyName")
+    new_strategy = strategist.deploy(Strategy, vault, "StrategyName", ilk_yieldBearing, gemJoinAdapter)
     vault.migrateStrategy(strategy, new_strategy, {"from": gov})
     orig_cdp_id = strategy.cdpId()
     new_strategy.shiftToCdp(orig_cdp_id, {"from": gov})
@@ -133,3 +133,58 @@ def test_triggers(
 
     strategy.harvestTrigger(0)
     strategy.tendTrigger(0)
+
+
+def test_deposit_above_max_single_trade_is_wound_in_chunks(
+    chain, gov, vault, strategy, token, amount, user, RELATIVE_APPROX_LOSSY
+):
+    # Wind at most 40% of the deposit per call
+    chunk = amount * 4 // 10
+    strategy.setMinMaxSingleTrade(strategy.minSingleTrade(), chunk, {"from": gov})
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+    assert pytest.approx(strategy.undeployedWant(), rel=RELATIVE_APPROX_LOSSY) == amount - chunk
+    assert strategy.tendTrigger(0) == True
+
+    # Each tend winds the next chunk until nothing is left idle
+    strategy.tend({"from": gov})
+    assert pytest.approx(strategy.undeployedWant(), rel=RELATIVE_APPROX_LOSSY) == amount - 2 * chunk
+    assert strategy.tendTrigger(0) == True
+    strategy.tend({"from": gov})
+
+    assert strategy.undeployedWant() == 0
+    assert strategy.tendTrigger(0) == False
+    assert pytest.approx(strategy.estimatedTotalAssets(), rel=RELATIVE_APPROX_LOSSY) == amount
+
+
+def test_tend_trigger_does_not_wind_want_that_does_not_pay_for_the_call(
+    chain, gov, vault, strategy, token, amount, user, token_whale
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    assert strategy.tendTrigger(0) == False
+
+    # A few DAI above minSingleTrade are undeployed but not worth a wind
+    token.transfer(strategy, 10e18, {"from": token_whale})
+    assert strategy.undeployedWant() > 0
+    strategy.setTendProfitability(0.2e18, 7 * 24 * 3600, {"from": gov})
+    assert strategy.tendTrigger(1e16) == False
+    assert strategy.tendTrigger(0) == True
+
+
+def test_wind_consumes_both_sides_of_the_mint(
+    chain, gov, vault, strategy, token, partnerToken, amount, user
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+    # The PSM swap is sized to the pool ratio and otherToken leftovers are sold back
+    assert partnerToken.balanceOf(strategy) == 0
+    assert strategy.balanceOfWant() < amount // 10_000
@@ -0,0 +1,44 @@
+import pytest
+
+from brownie import chain
+from helpers.maker import flashminted
+
+
+def test_small_withdrawal_flashmints_only_needed_amount(
+    vault, strategy, token, user, amount, gov, RELATIVE_APPROX, RELATIVE_APPROX_LOSSY
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    debtBefore = strategy.balanceOfDebt()
+    collateralBefore = strategy.balanceOfMakerVault()
+
+    # Withdraw 1% of the position
+    tx = vault.withdraw(vault.balanceOf(user) // 100, user, 100, {"from": user})
+
+    # Only the debt share of the withdrawal goes through the flashmint, and
+    # debt and collateral shrink proportionally instead of being re-drawn
+    loans = flashminted(tx)
+    assert len(loans) == 1
+    assert 0 < loans[0] < debtBefore * 2 // 100
+    assert pytest.approx(strategy.balanceOfDebt(), rel=RELATIVE_APPROX_LOSSY) == debtBefore * 99 // 100
+    assert pytest.approx(strategy.balanceOfMakerVault(), rel=RELATIVE_APPROX_LOSSY) == collateralBefore * 99 // 100
+    assert (
+        pytest.approx(strategy.getCurrentMakerVaultRatio(), rel=RELATIVE_APPROX)
+        == strategy.collateralizationRatio()
+    )
+    assert pytest.approx(token.balanceOf(user), rel=RELATIVE_APPROX_LOSSY) == amount // 100
+
+
+def test_withdraw_all_repays_full_debt(vault, strategy, token, user, amount, gov, RELATIVE_APPROX_LOSSY):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+    vault.withdraw(vault.balanceOf(user), user, 100, {"from": user})
+
+    assert strategy.balanceOfDebt() == 0
+    assert strategy.balanceOfMakerVault() == 0
+    assert pytest.approx(token.balanceOf(user), rel=RELATIVE_APPROX_LOSSY) == amount
@@ -0,0 +1,65 @@
+import pytest
+
+from brownie import chain
+from helpers.maker import flashminted
+
+
+def test_wind_event_reports_flashmint_and_resulting_position(
+    vault, strategy, token, user, amount, gov
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    tx = strategy.harvest({"from": gov})
+
+    assert len(tx.events["Wind"]) == 1
+    event = tx.events["Wind"][0]
+    assert event.address == strategy
+    # Maker flashmints without a fee
+    assert event["flashloanAmount"] == flashminted(tx)[0]
+    assert event["yieldBearingMinted"] == strategy.balanceOfMakerVault()
+    assert event["psmVolume"] > 0
+    assert event["debt"] == strategy.balanceOfDebt()
+    assert event["collateral"] == strategy.balanceOfMakerVault()
+
+
+def test_unwind_event_reports_burned_collateral(
+    vault, strategy, token, user, amount, gov
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    collateralBefore = strategy.balanceOfMakerVault()
+
+    tx = vault.withdraw(vault.balanceOf(user) // 100, user, 100, {"from": user})
+
+    assert len(tx.events["Unwind"]) == 1
+    event = tx.events["Unwind"][0]
+    assert event["flashloanAmount"] == flashminted(tx)[0]
+    assert event["yieldBearingBurned"] == collateralBefore - strategy.balanceOfMakerVault()
+    assert event["debt"] == strategy.balanceOfDebt()
+    assert event["collateral"] == strategy.balanceOfMakerVault()
+
+
+def test_rebalance_event_reports_ratio_before_and_after(
+    vault, strategy, token, user, amount, gov, RELATIVE_APPROX
+):
+    strategy.setCollateralizationRatio(1.05e18, {"from": gov})
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    ratioBefore = strategy.getCurrentMakerVaultRatio()
+
+    strategy.setCollateralizationRatio(1.023e18, {"from": gov})
+    tx = strategy.tend({"from": gov})
+
+    assert "Wind" in tx.events
+    assert len(tx.events["Rebalance"]) == 1
+    event = tx.events["Rebalance"][0]
+    assert event["ratioBefore"] == ratioBefore
+    assert event["ratioAfter"] == strategy.getCurrentMakerVaultRatio()
+    assert pytest.approx(event["ratioAfter"], rel=RELATIVE_APPROX) == strategy.collateralizationRatio()
+    assert event["debt"] == strategy.balanceOfDebt()
+    assert event["collateral"] == strategy.balanceOfMakerVault()